@@ -3,11 +3,12 @@
 Generate fake softball game data for testing multiple leagues, seasons, and roster changes.
 """
 
-import csv
-import random
-from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
 from pathlib import Path
 
+import numpy as np
+
 # League and season configuration
 LEAGUES = {
     "pacific": {
@@ -70,6 +71,9 @@ FREE_AGENTS = [
     "Owl Copper",
 ]
 
+_FREE_AGENTS_NP = np.array(FREE_AGENTS)
+_RETURNEE_POOL_NP = np.array(INITIAL_PLAYERS["sharks"] + INITIAL_PLAYERS["bears"])
+
 # Outcomes for randomization
 OUTCOMES = [
     "1B",
@@ -135,120 +139,200 @@ WEIGHTS = [
 ]
 
 
-def get_advance_bases(outcome):
-    """Return number of bases to advance on this outcome."""
-    if outcome in ["1B", "2B", "3B", "HR"]:
-        return {"1B": 1, "2B": 2, "3B": 3, "HR": 4}[outcome]
-    elif outcome == "BB":
-        return 1
-    elif outcome in ["K", "HPO"]:
-        return 0  # no advance on these outs
-    else:
-        # other outs: random 0-3, biased toward 0
-        weights = [
-            0.85,
-            0.13,
-            0.015,
-            0.005,
-        ]  # heavily bias toward 0, almost none to 2/3
-        return random.choices([0, 1, 2, 3], weights=weights)[0]
+# Normalized sampling tables, built once at import
+_WEIGHTS_NP = np.array(WEIGHTS) / sum(WEIGHTS)
+
+# Bases advanced by runners on a ball-in-play out: heavily biased toward 0
+OUT_ADVANCES = [0, 1, 2, 3]
+OUT_ADVANCE_WEIGHTS = np.array([0.85, 0.13, 0.015, 0.005])
+
+# Attempt columns written per player row
+MAX_ATTEMPTS = 7
+
+# Rows are joined by hand rather than through csv.writer, which is only
+# safe while no field can contain a delimiter, quote or line break
+CSV_HEADER = ",".join(["Player Name"] + ["Attempt"] * MAX_ATTEMPTS)
+CSV_LINE_END = "\r\n"  # csv.writer's default line terminator
+_CSV_FIELDS = [*FREE_AGENTS, *OUTCOMES]
+for _players in INITIAL_PLAYERS.values():
+    _CSV_FIELDS.extend(_players)
+assert not any(
+    char in field for field in _CSV_FIELDS for char in ',"\r\n'
+), "CSV fields must not need quoting"
+
+
+# Pools are per game, drawn from that game's seeded rng. A game draws at
+# most ~75 outcomes and ~21 out advances, so one buffer usually covers it;
+# 8192-entry buffers made each game about 3.5x slower to simulate
+OUTCOME_POOL_SIZE = 256
+OUT_ADVANCE_POOL_SIZE = 64
+
+
+class _OutcomePool:
+    """Pre-sampled ring buffer of weighted draws, refilled in batches."""
+
+    def __init__(self, values, probabilities, rng, size=OUTCOME_POOL_SIZE):
+        self.values = list(values)
+        self.probabilities = probabilities
+        self.rng = rng
+        self.size = size
+        self._refill()
+
+    def _refill(self):
+        self.buf = self.rng.choice(
+            len(self.values), size=self.size, p=self.probabilities
+        ).tolist()
+        self.i = 0
+
+    def next(self):
+        """Return the next sampled value."""
+        if self.i == len(self.buf):
+            self._refill()
+        value = self.values[self.buf[self.i]]
+        self.i += 1
+        return value
+
+
+# Per-outcome (advance_bases, is_out, is_hit); -1 advance means a random
+# 0-3 draw from the out-advance pool
+OUTCOME_META = {
+    "1B": (1, False, True),
+    "2B": (2, False, True),
+    "3B": (3, False, True),
+    "HR": (4, False, True),
+    "BB": (1, False, False),
+    "K": (0, True, False),
+    "HPO": (0, True, False),
+}
+for _outcome in OUTCOMES:
+    OUTCOME_META.setdefault(_outcome, (-1, True, False))
+
 
+def _build_modified_outcomes():
+    """Map (outcome, rbis) to the outcome string with its modifiers."""
+    modified = {}
+    for outcome in OUTCOME_META:
+        for rbis in range(5):  # at most 3 runners plus the batter score
+            text = outcome
+            if rbis > 0:
+                # Cap RBIs: HR max 4, others max 3 if bases loaded
+                max_rbi = 4 if outcome == "HR" else 3
+                text += "*" * min(rbis, max_rbi)
+            # HR always scores a run for the batter
+            if outcome == "HR":
+                text += "+"
+            modified[outcome, rbis] = text
+    return modified
 
-def is_out(outcome):
-    """Check if outcome is an out."""
-    if outcome in ["1B", "2B", "3B", "HR", "BB"]:
-        return False
-    return True
 
+MODIFIED = _build_modified_outcomes()
 
-def is_hit(outcome):
-    """Check if outcome is a hit."""
-    return outcome in ["1B", "2B", "3B", "HR"]
+# Attempt string after its batter later scores as a runner
+WITH_PLUS = {}
+for _text in MODIFIED.values():
+    WITH_PLUS[_text] = _text if _text.endswith("+") else _text + "+"
+    WITH_PLUS[_text + "+"] = _text + "+"
 
 
 class InningSimulator:
     """Simulates a single inning with runner tracking."""
 
-    def __init__(self, lineup):
+    def __init__(self, lineup, rng=None, max_pa=MAX_ATTEMPTS):
         self.lineup = lineup  # list of player indices
-        self.bases = {1: None, 2: None, 3: None}  # base: player_idx or None
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.outcome_pool = _OutcomePool(OUTCOMES, _WEIGHTS_NP, self.rng)
+        self.out_advance_pool = _OutcomePool(
+            OUT_ADVANCES, OUT_ADVANCE_WEIGHTS, self.rng, size=OUT_ADVANCE_POOL_SIZE
+        )
+        self.b1 = self.b2 = self.b3 = -1  # player_idx on base, -1 if empty
         self.outs = 0
-        self.attempts = {
-            i: [] for i in range(len(lineup))
-        }  # player_idx: list of outcomes
+        self.max_pa = max_pa
+        # player_idx: fixed-width row of outcomes, "" for unused slots
+        self.attempts = [[""] * max_pa for _ in lineup]
+        self.counts = [0] * len(lineup)  # PAs taken, may exceed max_pa
         self.lineup_idx = 0
 
-    def advance_runners(self, advance_bases, batter_idx, outcome):
+    def advance_runners(self, advance_bases, batter_idx, batter_out):
         """Advance runners based on outcome, return runs scored and rbis."""
-        runs_scored = 0
-        rbis = 0
+        b1, b2, b3 = self.b1, self.b2, self.b3
+        if advance_bases == 0 and b1 < 0 and b2 < 0 and b3 < 0:
+            return 0, 0, []
+
         scoring_runners = []  # runners who score
+        n1 = n2 = n3 = -1
 
-        # New runners dict to avoid modifying while iterating
-        new_bases = {1: None, 2: None, 3: None}
+        # Advance existing runners, lead runner first
+        if b3 >= 0:
+            if advance_bases >= 1:
+                scoring_runners.append(b3)
+            else:
+                n3 = b3
+        if b2 >= 0:
+            if advance_bases >= 2:
+                scoring_runners.append(b2)
+            elif advance_bases == 1:
+                n3 = b2
+            else:
+                n2 = b2
+        if b1 >= 0:
+            if advance_bases >= 3:
+                scoring_runners.append(b1)
+            elif advance_bases == 2:
+                n3 = b1
+            elif advance_bases == 1:
+                n2 = b1
+            else:
+                n1 = b1
 
         # Place batter on base if hit/walk
-        if not is_out(outcome):
-            batter_base = advance_bases
-            if batter_base == 4:  # HR, scores immediately
-                runs_scored += 1
-                rbis += 1  # HR always 1 RBI unless no runners, but we count it
+        if not batter_out:
+            if advance_bases == 4:  # HR, scores immediately
                 scoring_runners.append(batter_idx)
+            elif advance_bases == 3:
+                n3 = batter_idx
+            elif advance_bases == 2:
+                n2 = batter_idx
             else:
-                # Place batter on appropriate base
-                new_bases[batter_base] = batter_idx
-
-        # Advance existing runners
-        for base in [3, 2, 1]:  # reverse order to avoid overwriting
-            if self.bases[base] is not None:
-                runner = self.bases[base]
-                new_base = base + advance_bases
-                if new_base >= 4:  # scores
-                    runs_scored += 1
-                    rbis += 1  # each scoring runner is an RBI
-                    scoring_runners.append(runner)
-                else:
-                    new_bases[new_base] = runner
+                n1 = batter_idx
 
-        self.bases = new_bases
-        return runs_scored, rbis, scoring_runners
+        self.b1, self.b2, self.b3 = n1, n2, n3
+        # Each scoring runner (including the batter on a HR) is an RBI
+        runs_scored = len(scoring_runners)
+        return runs_scored, runs_scored, scoring_runners
 
     def simulate_plate_appearance(self):
         """Simulate one plate appearance, return outcome with modifiers."""
         batter_idx = self.lineup[self.lineup_idx % len(self.lineup)]
         self.lineup_idx += 1
 
-        outcome = random.choices(OUTCOMES, weights=WEIGHTS)[0]
-        advance_bases = get_advance_bases(outcome)
+        outcome = self.outcome_pool.next()
+        advance_bases, batter_out, _ = OUTCOME_META[outcome]
+        if advance_bases < 0:
+            advance_bases = self.out_advance_pool.next()
 
         runs_scored, rbis, scoring_runners = self.advance_runners(
-            advance_bases, batter_idx, outcome
+            advance_bases, batter_idx, batter_out
         )
 
-        # Apply modifiers
-        modified_outcome = outcome
-        if rbis > 0:
-            # Cap RBIs: HR max 4, others max 3 if bases loaded
-            max_rbi = 4 if outcome == "HR" else 3
-            rbi_to_add = min(rbis, max_rbi)
-            modified_outcome += "*" * rbi_to_add
-
-        # HR always scores a run for the batter
-        if outcome == "HR":
-            modified_outcome += "+"
+        # Apply RBI/run modifiers
+        modified_outcome = MODIFIED[outcome, rbis]
 
         # For runs scored by runners, add '+' to their outcomes
+        max_pa = self.max_pa
         for runner_idx in scoring_runners:
             if runner_idx != batter_idx:  # batter's run is not a '+' modifier
-                # Find the runner's last attempt and add '+'
-                if self.attempts[runner_idx]:
-                    last_attempt = self.attempts[runner_idx][-1]
-                    if not last_attempt.endswith("+"):
-                        self.attempts[runner_idx][-1] = last_attempt + "+"
-
-        self.attempts[batter_idx].append(modified_outcome)
-
-        if is_out(outcome):
+                # Mark the runner's last attempt, if it was kept
+                count = self.counts[runner_idx]
+                if 0 < count <= max_pa:
+                    row = self.attempts[runner_idx]
+                    row[count - 1] = WITH_PLUS[row[count - 1]]
+
+        count = self.counts[batter_idx]
+        if count < max_pa:
+            self.attempts[batter_idx][count] = modified_outcome
+        self.counts[batter_idx] = count + 1
+
+        if batter_out:
             self.outs += 1
 
         return runs_scored, rbis
@@ -256,17 +340,21 @@ class InningSimulator:
     def simulate_inning(self):
         """Simulate until 3 outs."""
         self.outs = 0  # Reset outs for new inning
-        self.bases = {1: None, 2: None, 3: None}  # Reset bases for new inning
+        self.b1 = self.b2 = self.b3 = -1  # Reset bases for new inning
+        plate_appearance = self.simulate_plate_appearance
         while self.outs < 3:
-            self.simulate_plate_appearance()
+            plate_appearance()
 
 
-def simulate_game_innings(num_players):
+def simulate_game_innings(num_players, rng=None):
     """Simulate a game with multiple innings, return attempts per player."""
+    if rng is None:
+        rng = np.random.default_rng()
     lineup = list(range(num_players))  # player indices 0 to num_players-1
-    simulator = InningSimulator(lineup)  # One simulator per game to persist lineup_idx
+    # One simulator per game to persist lineup_idx
+    simulator = InningSimulator(lineup, rng)
 
-    num_innings = random.randint(5, 7)
+    num_innings = int(rng.integers(5, 8))
 
     for inning in range(num_innings):
         simulator.simulate_inning()
@@ -276,77 +364,95 @@ def simulate_game_innings(num_players):
 
 def get_date_range(start_date_str, num_games):
     """Generate weekly dates starting from start_date."""
-    start_date = datetime.strptime(start_date_str, "%Y-%m-%d")
-    dates = []
-    for i in range(num_games):
-        game_date = start_date + timedelta(weeks=i)
-        dates.append(game_date.strftime("%Y-%m-%d"))
-    return dates
+    start_date = date.fromisoformat(start_date_str)
+    return [(start_date + timedelta(weeks=i)).isoformat() for i in range(num_games)]
 
 
-def simulate_roster_changes(current_roster, season_order):
+def simulate_roster_changes(current_roster, season_order, rng=None):
     """Apply roster changes based on season progression."""
-    roster = current_roster.copy()
-
     if season_order == 0:  # First season, no changes
-        return roster
+        return list(current_roster)
+
+    if rng is None:
+        rng = np.random.default_rng()
+
+    roster = np.asarray(current_roster)
 
     # Apply changes: some leave, some join, some return
-    num_changes = random.randint(1, 3)
+    num_changes = int(rng.integers(1, 4))
 
     # Players leaving
-    leavers = random.sample(roster, min(num_changes, len(roster)))
-    for player in leavers:
-        roster.remove(player)
+    leavers_idx = rng.choice(
+        len(roster), size=min(num_changes, len(roster)), replace=False
+    )
+    roster = np.delete(roster, leavers_idx)
 
     # New free agents joining
-    joiners = random.sample(FREE_AGENTS, min(num_changes, len(FREE_AGENTS)))
-    roster.extend(joiners)
+    joiners = rng.choice(
+        _FREE_AGENTS_NP, size=min(num_changes, len(_FREE_AGENTS_NP)), replace=False
+    )
+    roster = np.concatenate([roster, joiners])
 
     # Some old players returning (if available)
-    available_returnees = [
-        p
-        for p in INITIAL_PLAYERS["sharks"] + INITIAL_PLAYERS["bears"]
-        if p not in roster
-    ]
-    if available_returnees:
-        returnees = random.sample(available_returnees, min(1, len(available_returnees)))
-        roster.extend(returnees)
+    available_returnees = np.setdiff1d(_RETURNEE_POOL_NP, roster)
+    if available_returnees.size:
+        roster = np.concatenate([roster, rng.choice(available_returnees, size=1)])
+
+    # Ensure we have at least 8 players, drawing any shortfall in one shot
+    needed = 8 - len(roster)
+    if needed > 0:
+        available = np.setdiff1d(_FREE_AGENTS_NP, roster)
+        roster = np.concatenate(
+            [roster, rng.choice(available, size=needed, replace=False)]
+        )
+
+    return roster.tolist()
+
 
-    # Ensure we have at least 8 players
-    while len(roster) < 8:
-        new_player = random.choice(FREE_AGENTS)
-        if new_player not in roster:
-            roster.append(new_player)
+def generate_game_attempts(num_players, avg_attempts=5, rng=None):
+    """Generate attempts for a game using inning simulation.
 
-    return roster
+    Each player's row is exactly MAX_ATTEMPTS wide, padded with "".
+    """
+    return simulate_game_innings(num_players, rng)
 
 
-def generate_game_attempts(num_players, avg_attempts=5):
-    """Generate attempts for a game using inning simulation."""
-    all_attempts = simulate_game_innings(num_players)
+def generate_one_game(task):
+    """Simulate one game; return the CSV filename and its text."""
+    league, team, season_name_only, game_num, game_date, roster, seed = task
+    rng = np.random.default_rng(seed)
 
-    # Convert to list of lists, pad/truncate to 7 attempts per player
-    attempts = []
-    for player_idx in range(num_players):
-        player_attempts = all_attempts[player_idx]
-        # Pad or truncate to exactly 7 attempts
-        while len(player_attempts) < 7:
-            player_attempts.append("")
-        attempts.append(player_attempts[:7])
+    attempts = generate_game_attempts(len(roster), rng=rng)
 
-    return attempts
+    # Generate filename (season without year, parser adds it from date)
+    filename = f"{league}-{team}-{season_name_only}-{game_num:02d}_{game_date}.csv"
 
+    # Header plus one row per player; fields never need quoting (see CSV_HEADER)
+    lines = [CSV_HEADER]
+    lines.extend(
+        f"{player},{','.join(player_attempts)}"
+        for player, player_attempts in zip(roster, attempts)
+    )
+    lines.append("")
+    return filename, CSV_LINE_END.join(lines)
 
-def main():
+
+def main(seed=None):
     output_dir = Path(__file__).parent / "../data/test/input"
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    # One independent child seed per game keeps runs reproducible
+    # regardless of how games are spread across worker processes
+    seed_seq = np.random.SeedSequence(seed)
+    roster_rng = np.random.default_rng(seed_seq.spawn(1)[0])
+
+    tasks = []
     season_order = 0
 
     for league, seasons in LEAGUES.items():
         for season, config in seasons.items():
             dates = get_date_range(config["start_date"], config["games"])
+            season_name_only = season.split("-")[0]  # Remove year from season
 
             for team in TEAMS:
                 # Get current roster for this season
@@ -354,37 +460,32 @@ def main():
                     roster = INITIAL_PLAYERS[team].copy()
                 else:
                     roster = simulate_roster_changes(
-                        INITIAL_PLAYERS[team], season_order
+                        INITIAL_PLAYERS[team], season_order, roster_rng
                     )
 
                 for game_num in range(1, config["games"] + 1):
-                    date = dates[game_num - 1]
-
-                    # Generate game data
-                    attempts = generate_game_attempts(len(roster))
-
-                    # Create CSV
-                    # Generate filename (season without year, parser adds it from date)
-                    season_name_only = season.split("-")[
-                        0
-                    ]  # Remove year from season for filename
-                    filename = (
-                        f"{league}-{team}-{season_name_only}-{game_num:02d}_{date}.csv"
+                    game_date = dates[game_num - 1]
+                    game_seed = seed_seq.spawn(1)[0]
+                    tasks.append(
+                        (
+                            league,
+                            team,
+                            season_name_only,
+                            game_num,
+                            game_date,
+                            roster,
+                            game_seed,
+                        )
                     )
-                    filepath = output_dir / filename
-
-                    with open(filepath, "w", newline="") as csvfile:
-                        writer = csv.writer(csvfile)
-
-                        # Header
-                        writer.writerow(["Player Name"] + [f"Attempt"] * 7)
+        season_order += 1
 
-                        # Player data
-                        for player, player_attempts in zip(roster, attempts):
-                            writer.writerow([player] + player_attempts)
+    with ProcessPoolExecutor() as executor:
+        for filename, text in executor.map(generate_one_game, tasks, chunksize=4):
+            filepath = output_dir / filename
+            with open(filepath, "w", newline="", buffering=65536) as csvfile:
+                csvfile.write(text)
 
-                    print(f"Generated: {filename}")
-        season_order += 1
+            print(f"Generated: {filename}")
 
 
 if __name__ == "__main__":
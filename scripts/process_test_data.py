@@ -4,6 +4,7 @@ Process test data CSVs and generate comprehensive Excel export.
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add src to path for imports
@@ -34,35 +35,31 @@ def main():
 
     print(f"Found {len(csv_files)} CSV files to process")
 
-    for csv_file in csv_files:
-        print(f"Processing {csv_file.name}...")
-        try:
-            # Process the game file
-            process_use_case.execute(str(csv_file))
-
-            print(f"✓ Processed {csv_file.name}")
-        except Exception as e:
-            print(f"✗ Error processing {csv_file.name}: {e}")
-            continue
+    # Parse files concurrently; writes stay on this thread, in file order,
+    # with one connection and one commit for the whole batch
+    with ThreadPoolExecutor(max_workers=8) as executor, repo.session():
+        parse_futures = [
+            executor.submit(process_use_case.parse, str(csv_file))
+            for csv_file in csv_files
+        ]
+        for csv_file, parse_future in zip(csv_files, parse_futures):
+            print(f"Processing {csv_file.name}...")
+            try:
+                # Save the parsed game
+                process_use_case.persist(parse_future.result())
+
+                print(f"✓ Processed {csv_file.name}")
+            except Exception as e:
+                print(f"✗ Error processing {csv_file.name}: {e}")
+                continue
 
     # Generate comprehensive export
     output_path = "data/test/test.xlsx"
     print(f"Generating Excel export to {output_path}...")
 
     try:
-        # Get all teams
-        leagues = repo.list_leagues()
-        all_teams = []
-        for league in leagues:
-            teams = repo.list_teams_by_league(league.id)
-            all_teams.extend(teams)
-
-        team_stats = {}
-
-        for team in all_teams:
-            # Get cumulative stats for each team
-            cumulative_stats = calculator.get_cumulative_team_stats(team.name)
-            team_stats[team.name] = cumulative_stats
+        # Get cumulative stats for each team
+        team_stats = calculator.get_cumulative_stats_all_teams()
 
         stats_data = {"team_stats": team_stats}
 
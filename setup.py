@@ -26,6 +26,7 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=[
+        "numpy>=1.21.0",
         "pandas>=1.5.0",
         "openpyxl>=3.1.0",
     ],
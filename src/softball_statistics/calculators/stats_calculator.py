@@ -2,7 +2,12 @@
 Pure functions for calculating baseball/softball statistics.
 """
 
-from typing import Dict
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 def calculate_batting_average(hits: int, at_bats: int) -> float:
@@ -120,10 +125,14 @@ def calculate_batting_stats(
     Returns:
         Dictionary with all calculated statistics
     """
-    ba = calculate_batting_average(hits, at_bats)
-    obp = calculate_obp(hits, walks, hbp, at_bats, sf)
-    slg = calculate_slg(singles, doubles, triples, home_runs, at_bats)
-    ops = calculate_ops(obp, slg)
+    if at_bats == 0 and walks == 0 and hbp == 0 and hits == 0:
+        # Every rate has a zero numerator or denominator
+        ba = obp = slg = ops = 0.000
+    else:
+        ba = calculate_batting_average(hits, at_bats)
+        obp = calculate_obp(hits, walks, hbp, at_bats, sf)
+        slg = calculate_slg(singles, doubles, triples, home_runs, at_bats)
+        ops = calculate_ops(obp, slg)
 
     return {
         "at_bats": at_bats,
@@ -143,3 +152,84 @@ def calculate_batting_stats(
         "plate_appearances": plate_appearances,
         "sacrifice_flies": sf,
     }
+
+
+def _round_3(values: np.ndarray) -> np.ndarray:
+    """
+    Round each value to 3 places with round(), as the scalar functions do.
+
+    np.round scales by 1000 before rounding, which moves some ratios to the
+    other side of a tie (1/80 gives 0.012 instead of 0.013).
+    """
+    import numpy as np
+
+    rounded = [round(value, 3) for value in values.ravel().tolist()]
+    return np.array(rounded, dtype=float).reshape(values.shape)
+
+
+def _safe_ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Elementwise ratio rounded to 3 places, 0.000 where the denominator is 0."""
+    import numpy as np
+
+    ratio = np.divide(
+        numerator,
+        denominator,
+        out=np.zeros(denominator.shape, dtype=float),
+        where=denominator != 0,
+    )
+    return _round_3(ratio)
+
+
+def calculate_batting_stats_batch(
+    at_bats,
+    hits,
+    singles,
+    doubles,
+    triples,
+    home_runs,
+    walks,
+    hbp=0,
+    sf=0,
+) -> Dict[str, np.ndarray]:
+    """
+    Calculate rate statistics for many players at once.
+
+    Each argument is an array-like of counts with one entry per player;
+    scalars broadcast. Uses the same formulas and rounding as the scalar
+    functions, so each entry equals its scalar result exactly.
+
+    Args:
+        at_bats: At-bats per player
+        hits: Hits per player
+        singles: Singles per player
+        doubles: Doubles per player
+        triples: Triples per player
+        home_runs: Home runs per player
+        walks: Walks per player
+        hbp: Hit-by-pitches per player (default 0)
+        sf: Sacrifice flies per player (default 0)
+
+    Returns:
+        Dictionary of float arrays keyed like calculate_batting_stats
+    """
+    # Imported here so scalar-only callers (e.g. the CLI) skip loading numpy
+    import numpy as np
+
+    at_bats, hits, singles, doubles, triples, home_runs, walks, hbp, sf = (
+        np.broadcast_arrays(
+            at_bats, hits, singles, doubles, triples, home_runs, walks, hbp, sf
+        )
+    )
+    total_bases = singles + 2 * doubles + 3 * triples + 4 * home_runs
+
+    ba = _safe_ratio(hits, at_bats)
+    obp = _safe_ratio(hits + walks + hbp, at_bats + walks + hbp + sf)
+    slg = _safe_ratio(total_bases, at_bats)
+    ops = _round_3(obp + slg)
+
+    return {
+        "batting_average": ba,
+        "on_base_percentage": obp,
+        "slugging_percentage": slg,
+        "ops": ops,
+    }
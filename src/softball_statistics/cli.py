@@ -5,41 +5,150 @@ Command-line interface for softball statistics.
 from __future__ import annotations
 
 import argparse
+import multiprocessing
+import operator
+import os
 import sys
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from softball_statistics.exporters.excel_exporter import ExcelExporter, ExcelExportError
 from softball_statistics.interfaces import (
     CommandRepository,
     Exporter,
     Parser,
     QueryRepository,
 )
-from softball_statistics.parsers.csv_parser import CSVParseError, CSVParser
+from softball_statistics.parsers.filename_parser import parse_filename
 from softball_statistics.use_cases import (
     CalculateStatsUseCase,
     ListLeaguesUseCase,
     ListTeamsUseCase,
     ProcessGameUseCase,
     ValidationError,
+    parse_game_file,
 )
 
 
+def _parse_for_reparse(
+    parser: Parser, file_path: str
+) -> Tuple[str, Optional[Dict[str, Any]], Optional[str]]:
+    """Parse one file in a worker process, returning (path, data, error)."""
+    try:
+        return file_path, parse_game_file(parser, file_path), None
+    except Exception as e:
+        return file_path, None, str(e)
+
+
+_YES_ANSWERS = frozenset({"y", "yes"})
+
+_WARNING_FIELDS = operator.itemgetter(
+    "row_num", "col_num", "filename", "player_name", "assumption", "original_attempt"
+)
+
+
+def _format_warning(warning: Dict[str, Any]) -> str:
+    """Format one parsing warning as its two report lines."""
+    row_num, col_num, filename, player_name, assumption, original = _WARNING_FIELDS(
+        warning
+    )
+    if row_num and col_num and filename:
+        location = f" (row {row_num}, column {col_num} in {filename})"
+    elif filename:
+        location = f" (in {filename})"
+    else:
+        location = ""
+    return (
+        f"  - Player '{player_name}': {assumption}{location}\n"
+        f"    Original: '{original}'"
+    )
+
+
+@lru_cache(maxsize=1)
+def _build_arg_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser once; parse_args does not mutate it."""
+    parser = argparse.ArgumentParser(
+        description="Softball Statistics Tracker",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  softball-stats --file fray-cyclones-winter-01.csv --output data/output/stats.xlsx
+  softball-stats --list-leagues
+  softball-stats --list-teams --league "Fray"
+  softball-stats --reparse-all
+        """,
+    )
+
+    parser.add_argument(
+        "--file",
+        type=str,
+        help="CSV file to process (with format: league-team-season-game.csv)",
+    )
+
+    parser.add_argument(
+        "--output",
+        type=str,
+        default="data/output/stats.xlsx",
+        help="Output Excel file path (default: data/output/stats.xlsx)",
+    )
+
+    parser.add_argument(
+        "--list-leagues",
+        action="store_true",
+        help="List all leagues in the database",
+    )
+
+    parser.add_argument(
+        "--list-teams", action="store_true", help="List teams (requires --league)"
+    )
+
+    parser.add_argument("--league", type=str, help="League name for --list-teams")
+
+    parser.add_argument(
+        "--reparse-all",
+        action="store_true",
+        help="Wipe database and reparse all CSV files in data/input/",
+    )
+
+    parser.add_argument(
+        "--replace-existing",
+        "--force",
+        action="store_true",
+        help="Replace existing games without prompting",
+    )
+
+    parser.add_argument(
+        "--db",
+        type=str,
+        default="stats.db",
+        help="SQLite database file path (default: stats.db)",
+    )
+
+    return parser
+
+
 class CLI:
     """Command-line interface class."""
 
+    # Command flags mapped to the method that handles them
+    _COMMANDS = {
+        "list_leagues": "_run_list_leagues",
+        "list_teams": "_run_list_teams",
+        "reparse_all": "_reparse_all",
+        "file": "_run_process_file",
+    }
+
     def __init__(
         self,
         command_repo: CommandRepository,
         query_repo: QueryRepository,
         parser: Parser,
-        exporter: Exporter,
+        exporter: Optional[Exporter] = None,
     ):
         self.command_repo = command_repo
         self.query_repo = query_repo
         self.parser = parser
-        self.exporter = exporter
+        self._exporter = exporter
         self.process_game_use_case = ProcessGameUseCase(
             parser, command_repo, query_repo
         )
@@ -47,88 +156,63 @@ class CLI:
         self.list_leagues_use_case = ListLeaguesUseCase(query_repo)
         self.list_teams_use_case = ListTeamsUseCase(query_repo)
 
-    def run(self, args: Optional[list[str]] = None) -> None:
-        """Run the CLI with given arguments."""
-        parser = argparse.ArgumentParser(
-            description="Softball Statistics Tracker",
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog="""
-Examples:
-  softball-stats --file fray-cyclones-winter-01.csv --output data/output/stats.xlsx
-  softball-stats --list-leagues
-  softball-stats --list-teams --league "Fray"
-  softball-stats --reparse-all
-            """,
-        )
-
-        parser.add_argument(
-            "--file",
-            type=str,
-            help="CSV file to process (with format: league-team-season-game.csv)",
-        )
-
-        parser.add_argument(
-            "--output",
-            type=str,
-            default="data/output/stats.xlsx",
-            help="Output Excel file path (default: data/output/stats.xlsx)",
-        )
+    @property
+    def exporter(self) -> Exporter:
+        """Exporter, defaulting to Excel; created on first use."""
+        if self._exporter is None:
+            from softball_statistics.exporters.excel_exporter import ExcelExporter
 
-        parser.add_argument(
-            "--list-leagues",
-            action="store_true",
-            help="List all leagues in the database",
-        )
-
-        parser.add_argument(
-            "--list-teams", action="store_true", help="List teams (requires --league)"
-        )
+            self._exporter = ExcelExporter(self.query_repo)  # type: ignore
+        return self._exporter
 
-        parser.add_argument("--league", type=str, help="League name for --list-teams")
-
-        parser.add_argument(
-            "--reparse-all",
-            action="store_true",
-            help="Wipe database and reparse all CSV files in data/input/",
-        )
-
-        parser.add_argument(
-            "--replace-existing",
-            action="store_true",
-            help="Replace existing games without prompting",
-        )
+    def run(self, args: Optional[list[str]] = None) -> None:
+        """Run the CLI with given arguments."""
+        parser = _build_arg_parser()
+        args_parsed = parser.parse_args(args)
 
-        parser.add_argument(
-            "--db",
-            type=str,
-            default="stats.db",
-            help="SQLite database file path (default: stats.db)",
+        # First flag that is set wins, in the order of _COMMANDS
+        handler = next(
+            (
+                method
+                for flag, method in self._COMMANDS.items()
+                if getattr(args_parsed, flag)
+            ),
+            None,
         )
-
-        args_parsed = parser.parse_args(args)
+        if handler is None:
+            parser.print_help()
+            sys.exit(1)
 
         try:
-            if args_parsed.list_leagues:
-                self._list_leagues()
-            elif args_parsed.list_teams:
-                if not args_parsed.league:
-                    print("Error: --league is required with --list-teams")
-                    sys.exit(1)
-                self._list_teams(args_parsed.league)
-            elif args_parsed.reparse_all:
-                self._reparse_all(args_parsed)
-            elif args_parsed.file:
-                self._process_file(
-                    args_parsed.file, args_parsed.output, args_parsed.replace_existing
-                )
-            else:
-                parser.print_help()
-                sys.exit(1)
-
+            getattr(self, handler)(args_parsed)
         except Exception as e:
             print(f"Error: {e}")
             sys.exit(1)
 
+    def _run_list_leagues(self, args: argparse.Namespace) -> None:
+        """Handle --list-leagues."""
+        self._list_leagues()
+
+    def _run_list_teams(self, args: argparse.Namespace) -> None:
+        """Handle --list-teams, which requires --league."""
+        if not args.league:
+            print("Error: --league is required with --list-teams")
+            sys.exit(1)
+        self._list_teams(args.league)
+
+    def _run_process_file(self, args: argparse.Namespace) -> None:
+        """Handle --file."""
+        self._process_file(args.file, args.output, args.replace_existing)
+
+    @staticmethod
+    def _confirm(prompt: str) -> bool:
+        """Ask a yes/no question; never block when stdin is not a terminal."""
+        if not sys.stdin.isatty():
+            # Nobody can answer, so take the prompt's default of "no"
+            print(f"{prompt}n (stdin is not a terminal; use --force to replace)")
+            return False
+        return input(prompt).strip().lower() in _YES_ANSWERS
+
     def _list_leagues(self) -> None:
         """List all leagues."""
         leagues = self.list_leagues_use_case.execute()
@@ -158,54 +242,74 @@ Examples:
 
     def _reparse_all(self, args) -> None:
         """Wipe database and reparse all CSV files in data/input/."""
-        from pathlib import Path
-
         print("⚠️  This will wipe the database and reparse all files in data/input/")
 
-        print("Wiping database...")
-        # Clear all data
-
-        sqlite_repo = self.command_repo  # type: ignore
-        with sqlite_repo._get_connection() as conn:  # type: ignore
-            cursor = conn.cursor()
-            # Delete in reverse dependency order
-            cursor.execute("DELETE FROM parsing_warnings")
-            cursor.execute("DELETE FROM plate_appearances")
-            cursor.execute("DELETE FROM games")
-            cursor.execute("DELETE FROM players")
-            cursor.execute("DELETE FROM weeks")
-            cursor.execute("DELETE FROM teams")
-            cursor.execute("DELETE FROM leagues")
-            conn.commit()
-
         # Find all CSV files in data/input/
-        input_dir = Path("data/input")
-        if not input_dir.exists():
-            print(f"Error: {input_dir} directory not found")
-            return
-
-        csv_files = list(input_dir.glob("*.csv"))
-        if not csv_files:
-            print(f"No CSV files found in {input_dir}")
-            return
-
-        print(f"Found {len(csv_files)} CSV files to process...")
-
-        success_count = 0
-        error_count = 0
-
-        for csv_file in csv_files:
-            try:
-                print(f"Processing {csv_file.name}...")
-                self.process_game_use_case.execute(
-                    str(csv_file), replace_existing=False
+        input_dir = "data/input"
+        csv_files: Optional[List[str]] = None
+        if os.path.isdir(input_dir):
+            with os.scandir(input_dir) as entries:
+                csv_files = [
+                    entry.path
+                    for entry in entries
+                    if entry.is_file(follow_symlinks=False)
+                    and entry.name.lower().endswith(".csv")
+                ]
+
+        # Parse on all cores before the session opens, so workers never
+        # inherit its connection and the write lock is not held while parsing
+        results: List[Tuple[str, Optional[Dict[str, Any]], Optional[str]]] = []
+        if csv_files:
+            print(f"Found {len(csv_files)} CSV files to process...")
+            workers = os.cpu_count() or 1
+            chunksize = max(1, len(csv_files) // (4 * workers))
+            with multiprocessing.Pool(processes=workers) as pool:
+                results = sorted(
+                    pool.imap_unordered(
+                        partial(_parse_for_reparse, self.parser),
+                        csv_files,
+                        chunksize=chunksize,
+                    ),
+                    key=lambda result: result[0],
                 )
-                success_count += 1
-            except Exception as e:
-                print(f"Error processing {csv_file.name}: {e}")
-                error_count += 1
 
-        print(f"\nReparsing complete: {success_count} successful, {error_count} errors")
+        # One connection and page cache for the wipe and every save
+        with self.command_repo.session():
+            print("Wiping database...")
+            self.command_repo.clear_all_data()
+
+            if csv_files is None:
+                print(f"Error: {input_dir} directory not found")
+                return
+            if not csv_files:
+                print(f"No CSV files found in {input_dir}")
+                return
+
+            success_count = 0
+            error_count = 0
+
+            # Save every parsed game in one batch, in filename order
+            parsed = [result for result in results if result[2] is None]
+            save_errors = self.process_game_use_case.persist_batch(
+                [parsed_data for _, parsed_data, _ in parsed]
+            )
+            errors = dict(zip((file_path for file_path, _, _ in parsed), save_errors))
+
+            # Report every file in one write rather than a print per line
+            lines = []
+            for file_path, _, parse_error in results:
+                file_name = os.path.basename(file_path)
+                lines.append(f"Processing {file_name}...")
+                error = parse_error or errors.get(file_path)
+                if error is None:
+                    success_count += 1
+                else:
+                    lines.append(f"Error processing {file_name}: {error}")
+                    error_count += 1
+            lines.append(
+                f"\nReparsing complete: {success_count} successful, {error_count} errors"
+            )
+            sys.stdout.write("\n".join(lines) + "\n")
         if success_count > 0:
             print("Database has been rebuilt with formatted team/league names.")
             # Export stats if output path provided
@@ -224,7 +328,37 @@ Examples:
         self, file_path: str, output_path: str, replace_existing: bool
     ) -> None:
         """Process a CSV file."""
+        from softball_statistics.exporters.excel_exporter import ExcelExportError
+        from softball_statistics.parsers.csv_parser import CSVParseError
+        from softball_statistics.parsers.filename_parser import FilenameParseError
+
         try:
+            # Check for an existing game from the filename alone, so a
+            # cancelled replace never reads or parses the CSV
+            if not replace_existing:
+                try:
+                    metadata = parse_filename(Path(file_path).name)
+                except FilenameParseError:
+                    metadata = None  # Let the parser report the bad filename
+                if metadata is not None:
+                    assert metadata["league"] is not None
+                    assert metadata["team"] is not None
+                    assert metadata["season"] is not None
+                    assert metadata["game"] is not None
+                    if self.query_repo.game_exists(
+                        metadata["league"],
+                        metadata["team"],
+                        metadata["season"],
+                        metadata["game"],
+                    ):
+                        if not self._confirm(
+                            f"Game {metadata['league']}-{metadata['team']}-{metadata['season']}-{metadata['game']} already exists. Replace? (y/N): "
+                        ):
+                            print("Operation cancelled.")
+                            return
+                        print("Replacing existing game data...")
+                        replace_existing = True
+
             # Process the file using use case
             print(f"Parsing {file_path}...")
             parsed_data = self.process_game_use_case.execute(
@@ -251,70 +385,16 @@ Examples:
             # Display parsing warnings if any
             warnings = parsed_data.get("warnings", [])
             if warnings:
-                print(f"\n⚠️  Parsing Warnings ({len(warnings)}):")
-                for warning in warnings:
-                    location = ""
-                    if (
-                        warning["row_num"]
-                        and warning["col_num"]
-                        and warning["filename"]
-                    ):
-                        location = f" (row {warning['row_num']}, column {warning['col_num']} in {warning['filename']})"
-                    elif warning["filename"]:
-                        location = f" (in {warning['filename']})"
-
-                    print(
-                        f"  - Player '{warning['player_name']}': {warning['assumption']}{location}"
-                    )
-                    print(f"    Original: '{warning['original_attempt']}'")
+                sys.stdout.write(
+                    f"\n⚠️  Parsing Warnings ({len(warnings)}):\n"
+                    + "\n".join(map(_format_warning, warnings))
+                    + "\n"
+                )
 
         except ValidationError as e:
             print(f"Validation Error: {e}")
             sys.exit(1)
-        except ValueError as e:
-            # Game exists, ask to replace
-            if "already exists" in str(e):
-                if not replace_existing:
-                    # Parse filename to get metadata for prompt
-                    from softball_statistics.parsers.filename_parser import (
-                        parse_filename,
-                    )
-
-                    metadata = parse_filename(Path(file_path).name)
-                    assert metadata["league"] is not None
-                    assert metadata["team"] is not None
-                    assert metadata["season"] is not None
-                    response = input(
-                        f"Game {metadata['league']}-{metadata['team']}-{metadata['season']}-{metadata['game']} already exists. Replace? (y/N): "
-                    )
-                    if response.lower() in ["y", "yes"]:
-                        print("Replacing existing game data...")
-                        parsed_data = self.process_game_use_case.execute(
-                            file_path, replace_existing=True
-                        )
-                        # Continue with stats and export
-                        stats_data = self.calculate_stats_use_case.execute(
-                            metadata["league"], metadata["team"], metadata["season"]
-                        )
-                        print(f"Exporting to {output_path}...")
-                        self.exporter.export(
-                            stats_data,
-                            output_path,
-                            team_name=metadata["team"],
-                            season=metadata["season"],
-                            use_case=self.calculate_stats_use_case,
-                        )
-                        print(f"Success! Statistics exported to {output_path}")
-                    else:
-                        print("Operation cancelled.")
-                else:
-                    # Should not reach here if replace_existing=True
-                    print(f"Processing failed: {e}")
-                    sys.exit(1)
-            else:
-                print(f"Processing failed: {e}")
-                sys.exit(1)
-        except (CSVParseError, ExcelExportError) as e:
+        except (ValueError, CSVParseError, ExcelExportError) as e:
             print(f"Processing failed: {e}")
             sys.exit(1)
 
@@ -328,14 +408,15 @@ def main():
 
     # TODO: Use DI container or factory to inject dependencies
     # For now, hardcoded for transition
+    from softball_statistics.parsers.csv_parser import CSVParser
     from softball_statistics.repository.sqlite import SQLiteRepository
 
     db_path = db_args.db
     repo = SQLiteRepository(db_path)  # type: ignore
     parser = CSVParser()
-    exporter = ExcelExporter(repo)
 
-    cli = CLI(repo, repo, parser, exporter)
+    # Excel exporter is imported only by commands that export
+    cli = CLI(repo, repo, parser)
     cli.run(remaining_args)
 
 
@@ -5,20 +5,26 @@ Excel exporter for softball statistics.
 from __future__ import annotations
 
 import logging
+from contextlib import ExitStack
+from functools import lru_cache
+from itertools import groupby
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Border, Side
 from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.dimensions import ColumnDimension
 
 from softball_statistics.calculators.stats_calculator import (
     calculate_batting_average,
+    calculate_batting_stats_batch,
     calculate_ops,
     calculate_slg,
 )
 from softball_statistics.interfaces import QueryRepository
-from softball_statistics.models import PlayerStats
+from softball_statistics.repository.sqlite import SQLiteQueryRepository
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +51,15 @@ class ExcelExporter:
         export_to_excel(data, output_path, self.query_repo, team_name, season, use_case)
 
 
+# Seasons by team name, and (team ID, league) by (team name, season)
+_TeamSeasonIndex = Tuple[Dict[str, List[str]], Dict[Tuple[str, str], Tuple[int, str]]]
+
+# Shared by every totals row; openpyxl dedupes styles, so one instance is enough
+_THIN = Side(style="thin")
+_TOTALS_BORDER = Border(left=_THIN, right=_THIN, top=_THIN, bottom=_THIN)
+
+
+@lru_cache(maxsize=256)
 def _abbreviate_team_name(team_name: str) -> str:
     """
     Abbreviate team name to 5 characters for Excel sheet names.
@@ -71,6 +86,167 @@ def _abbreviate_team_name(team_name: str) -> str:
             return word[:5]  # Truncate to 5 chars
 
 
+# Counting-stat columns summed into a TEAM TOTALS row
+_COUNT_COLUMNS = (
+    "PA",
+    "AB",
+    "H",
+    "1B",
+    "2B",
+    "3B",
+    "HR",
+    "BB",
+    "SF",
+    "HRO",
+    "RBI",
+    "R",
+)
+_TEAM_COUNT_COLUMNS = tuple(column for column in _COUNT_COLUMNS if column != "HRO")
+
+
+def _column_totals(
+    rows: list[Dict[str, Any]], columns: Tuple[str, ...]
+) -> Dict[str, int]:
+    """Sum each of the given columns over the rows in a single array pass."""
+    # Imported here so exports that write no totals rows skip loading numpy
+    import numpy as np
+
+    counts = np.array(
+        [[row[column] for column in columns] for row in rows], dtype=np.int64
+    ).reshape(-1, len(columns))
+    return dict(zip(columns, counts.sum(axis=0).tolist()))
+
+
+# Column widths by header name; headers not listed get _DEFAULT_WIDTH
+_DEFAULT_WIDTH = 12
+_STAT_WIDTHS = {
+    "Player": 20,
+    **dict.fromkeys(_COUNT_COLUMNS, 8),
+    **dict.fromkeys(("BA", "OBP", "SLG", "OPS"), 10),
+}
+_LEAGUE_SUMMARY_WIDTHS = {
+    "League": 20,
+    "Team": 20,
+    "Games Played": 20,
+    "Total Players": 16,
+}
+_LEGEND_WIDTHS = {"Abbreviation": 15, "Full Name": 25, "Formula": 40}
+_PLAYER_DETAILS_HEADER = ("Team", "Player", "Statistic", "Value")
+_PLAYER_DETAILS_WIDTHS = {"Team": 20, "Player": 20, "Statistic": 20}
+
+
+def _apply_column_widths(
+    worksheet, columns: Iterable[str], widths: Dict[str, int] = _STAT_WIDTHS
+) -> None:
+    """
+    Set each column's width from its header, in sheet column order.
+
+    Adjacent columns of equal width share one column range, so a stat sheet
+    gets three width entries instead of seventeen.
+    """
+    first = 1
+    for width, run in groupby(widths.get(column, _DEFAULT_WIDTH) for column in columns):
+        last = first + len(list(run)) - 1
+        letter = get_column_letter(first)
+        worksheet.column_dimensions[letter] = ColumnDimension(
+            worksheet, index=letter, min=first, max=last, width=width
+        )
+        first = last + 1
+
+
+# Player stats key behind each counting column, and behind each rate column
+_COUNT_KEYS = {
+    "PA": "plate_appearances",
+    "AB": "at_bats",
+    "H": "hits",
+    "1B": "singles",
+    "2B": "doubles",
+    "3B": "triples",
+    "HR": "home_runs",
+    "BB": "walks",
+    "SF": "sacrifice_flies",
+    "HRO": "home_run_outs",
+    "RBI": "rbis",
+    "R": "runs_scored",
+}
+_RATE_KEYS = (
+    ("BA", "batting_average"),
+    ("OBP", "on_base_percentage"),
+    ("SLG", "slugging_percentage"),
+    ("OPS", "ops"),
+)
+_TEAM_RATE_KEYS = tuple((column, f"team_{key}") for column, key in _RATE_KEYS)
+
+
+def _player_row(
+    player_info: Dict[str, Any], count_columns: Tuple[str, ...] = _COUNT_COLUMNS
+) -> Dict[str, Any]:
+    """Build a player's sheet row: name, counting stats, then rate stats."""
+    row: Dict[str, Any] = {
+        "Player": player_info.get(
+            "player_name", f"Player {player_info.get('player_id', 'Unknown')}"
+        )
+    }
+    for column in count_columns:
+        row[column] = player_info.get(_COUNT_KEYS[column], 0)
+    for column, key in _RATE_KEYS:
+        row[column] = f"{player_info.get(key, 0):.3f}"
+    return row
+
+
+def _totals_row(
+    player_data: list[Dict[str, Any]],
+    team_totals: Dict[str, Any],
+    count_columns: Tuple[str, ...] = _COUNT_COLUMNS,
+) -> Dict[str, Any]:
+    """Build a TEAM TOTALS row from summed player rows and team rate stats."""
+    row: Dict[str, Any] = {
+        "Player": "TEAM TOTALS",
+        **_column_totals(player_data, count_columns),
+    }
+    for column, key in _TEAM_RATE_KEYS:
+        row[column] = f"{team_totals.get(key, 0):.3f}"
+    return row
+
+
+def _append_rows(worksheet, rows: list[Dict[str, Any]]) -> None:
+    """Append a header row from the first row's keys, then each row's values."""
+    worksheet.append(list(rows[0]))
+    for row in rows:
+        worksheet.append(list(row.values()))
+
+
+def _append_totals_row(worksheet, values: list) -> None:
+    """Append an empty separator row, then a totals row with thin borders."""
+    cells = []
+    for value in values:
+        cell = WriteOnlyCell(worksheet, value=value)
+        cell.border = _TOTALS_BORDER
+        cells.append(cell)
+    worksheet.append([])
+    worksheet.append(cells)
+
+
+def _data_range(rows: list[Dict[str, Any]]) -> str:
+    """Cell range covering the header and data rows, e.g. A1:Q9."""
+    return f"A1:{get_column_letter(len(rows[0]))}{len(rows) + 1}"
+
+
+def _finalize_stat_sheet(
+    worksheet, player_data: list[Dict[str, Any]], totals_row: Dict[str, Any]
+) -> None:
+    """Write the header, player rows and totals row, then filter the table."""
+    _append_rows(worksheet, player_data)
+    _append_totals_row(worksheet, list(totals_row.values()))
+    # Autofilter covers the header and player rows, not the totals row
+    worksheet.auto_filter.ref = _data_range(player_data)
+
+
+def _sort_by_player(rows: list[Dict[str, Any]]) -> None:
+    """Sort rows by Player name alphabetically (case-insensitive), in place."""
+    rows.sort(key=lambda row: row["Player"].lower())
+
+
 def export_to_excel(
     stats_data: Dict[str, Any],
     output_path: str,
@@ -92,114 +268,93 @@ def export_to_excel(
     try:
         path = Path(output_path)
         path.parent.mkdir(parents=True, exist_ok=True)
+        team_stats_map = stats_data.get("team_stats") or {}
+
+        # Run every export query on one connection when the repository
+        # supports sessions, instead of connecting once per helper call, and
+        # compute each team's cumulative stats once for the summary and team
+        # sheets
+        session = getattr(query_repo, "session", None)
+        caching = getattr(use_case, "caching", None)
+        with ExitStack() as stack:
+            if session:
+                stack.enter_context(session())
+            if caching:
+                stack.enter_context(caching())
+            # Write-only workbooks stream each row to disk as it is appended
+            # instead of keeping every cell of every sheet in memory until save
+            workbook = Workbook(write_only=True)
 
-        with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
             # Create legend sheet first
-            _create_legend_sheet(writer)
+            _create_legend_sheet(workbook)
 
             # Always create league summary sheet
-            _create_league_summary_sheet(stats_data, writer, query_repo, use_case)
+            _create_league_summary_sheet(stats_data, workbook, query_repo, use_case)
 
             # Create comprehensive player summary sheet (if query_repo available)
             if query_repo:
-                _create_player_summary_sheet(query_repo, writer)
-
-            # Team sheets - now with cumulative and per-season structure
-            if team_name and use_case:
-                # Create cumulative total sheet
-                cumulative_stats = use_case.get_cumulative_team_stats(team_name)
-                _create_cumulative_team_sheet(team_name, cumulative_stats, writer)
-
-                # Get all seasons for this team, sorted chronologically
-                seasons = _get_seasons_for_team(team_name, query_repo)
-                for season_name in seasons:
-                    # Create season total sheet
-                    season_stats = use_case.execute(
-                        _get_league_for_team_season(team_name, season_name, query_repo),
-                        team_name,
-                        season_name,
+                _create_player_summary_sheet(query_repo, workbook)
+
+            # Team sheets - now with cumulative and per-season structure,
+            # for the given team or every team in the database
+            if use_case and (team_name or query_repo):
+                teams_to_export = (
+                    [team_name] if team_name else _get_all_teams(query_repo)
+                )
+                team_index = _load_team_season_index(query_repo)
+                for team_name_key in teams_to_export:
+                    _create_team_detail_sheets(
+                        team_name_key, use_case, workbook, team_index
                     )
-                    _create_season_total_sheet(
-                        team_name, season_name, season_stats, writer
-                    )
-
-                    # Create per-game sheets
-                    if season_stats.get("team_stats", {}).get(team_name):
-                        team_id = _get_team_id(team_name, season_name, query_repo)
-                        if team_id:
-                            games_stats = use_case.get_team_games_stats(team_id)
-                            for game_stat in games_stats:
-                                player_stats = use_case.get_game_player_stats(
-                                    game_stat["game_id"]
-                                )
-                                _create_per_game_sheet(
-                                    team_name, game_stat, player_stats, writer
-                                )
-            elif use_case and query_repo:
-                # Multi-team detailed export mode - create detailed sheets for all teams
-                all_teams = _get_all_teams(query_repo)
-                for team_name_key in all_teams:
-                    # Create cumulative team sheet
-                    cumulative_stats = use_case.get_cumulative_team_stats(team_name_key)
-                    if cumulative_stats.get("players"):  # Only create if team has data
-                        _create_cumulative_team_sheet(
-                            team_name_key, cumulative_stats, writer
-                        )
-
-                        # Get all seasons for this team, sorted chronologically
-                        seasons = _get_seasons_for_team(team_name_key, query_repo)
-                        for season_name in seasons:
-                            # Create season total sheet
-                            season_stats = use_case.execute(
-                                _get_league_for_team_season(
-                                    team_name_key, season_name, query_repo
-                                ),
-                                team_name_key,
-                                season_name,
-                            )
-                            _create_season_total_sheet(
-                                team_name_key, season_name, season_stats, writer
-                            )
-
-                            # Create per-game sheets
-                            if season_stats.get("team_stats", {}).get(team_name_key):
-                                team_id = _get_team_id(
-                                    team_name_key, season_name, query_repo
-                                )
-                                if team_id:
-                                    games_stats = use_case.get_team_games_stats(team_id)
-                                    for game_stat in games_stats:
-                                        player_stats = use_case.get_game_player_stats(
-                                            game_stat["game_id"]
-                                        )
-                                        _create_per_game_sheet(
-                                            team_name_key,
-                                            game_stat,
-                                            player_stats,
-                                            writer,
-                                        )
             else:
                 # Fallback to original team sheets
-                for team_name_key, team_stats in stats_data.get(
-                    "team_stats", {}
-                ).items():
-                    _create_team_sheet(team_name_key, team_stats, writer)
+                for team_name_key, team_stats in team_stats_map.items():
+                    _create_team_sheet(team_name_key, team_stats, workbook)
 
-            # Individual player sheets (if requested)
+            # Player details (if requested), as one table for every player
             if stats_data.get("include_player_details", False):
-                for team_name, team_stats in stats_data.get("team_stats", {}).items():
-                    for player_stats in team_stats.get("players", []):
-                        _create_player_sheet(player_stats, writer)
+                _create_player_details_sheet(team_stats_map, workbook)
 
+        workbook.save(output_path)
         logger.info(f"Successfully exported statistics to {output_path}")
 
     except Exception as e:
         raise ExcelExportError(f"Failed to export to Excel: {e}")
 
 
+def _create_team_detail_sheets(
+    team_name: str,
+    use_case,
+    workbook: Workbook,
+    team_index: _TeamSeasonIndex,
+) -> None:
+    """Create a team's cumulative, season total and per-game sheets."""
+    # Create cumulative team sheet
+    cumulative_stats = use_case.get_cumulative_team_stats(team_name)
+    if not cumulative_stats.get("players"):  # Only create if team has data
+        return
+    _create_cumulative_team_sheet(team_name, cumulative_stats, workbook)
+
+    # Get all seasons for this team, sorted chronologically
+    seasons_by_team, team_seasons = team_index
+    for season_name in seasons_by_team.get(team_name, []):
+        team_id, league_name = team_seasons[team_name, season_name]
+
+        # Create season total sheet
+        season_stats = use_case.execute(league_name, team_name, season_name)
+        _create_season_total_sheet(team_name, season_name, season_stats, workbook)
+
+        # Create per-game sheets
+        if season_stats.get("team_stats", {}).get(team_name) and team_id:
+            # Stream one game's player stats at a time into its sheet
+            game_stream = use_case.iter_team_game_player_stats(team_id)
+            for game_stat, player_stats in game_stream:
+                _create_per_game_sheet(team_name, game_stat, player_stats, workbook)
+
+
 def _create_league_summary_sheet(
     stats_data: Dict[str, Any],
-    writer: pd.ExcelWriter,
+    workbook: Workbook,
     query_repo: Optional[QueryRepository] = None,
     use_case=None,
 ) -> None:
@@ -232,23 +387,14 @@ def _create_league_summary_sheet(
             }
         ]
 
-    # Create DataFrame and Excel sheet
-    df = pd.DataFrame(summary_data)
-    df.to_excel(writer, sheet_name="League Summary", index=False)
-
-    # Format the sheet
-    worksheet = writer.sheets["League Summary"]
-    worksheet.column_dimensions["A"].width = 20  # League
-    worksheet.column_dimensions["B"].width = 20  # Team
-    worksheet.column_dimensions["C"].width = 20  # Games Played
-    worksheet.column_dimensions["D"].width = 16  # Total Players
-    worksheet.column_dimensions["E"].width = 12  # Team BA
-    worksheet.column_dimensions["F"].width = 12  # Team OBP
-    worksheet.column_dimensions["G"].width = 12  # Team SLG
-    worksheet.column_dimensions["H"].width = 12  # Team OPS
+    # Create Excel sheet
+    # Format the sheet; write-only sheets need this before the first row
+    worksheet = workbook.create_sheet("League Summary")
+    _apply_column_widths(worksheet, summary_data[0], _LEAGUE_SUMMARY_WIDTHS)
 
     # Add autofilter to column headers
-    worksheet.auto_filter.ref = worksheet.dimensions
+    worksheet.auto_filter.ref = _data_range(summary_data)
+    _append_rows(worksheet, summary_data)
 
 
 def _build_summary_from_stats_data(
@@ -260,10 +406,9 @@ def _build_summary_from_stats_data(
     # Get league name from stats_data if available
     default_league = stats_data.get("league_name", "Unknown League")
     if default_league and isinstance(default_league, str):
-        # Convert snake_case to Title Case (e.g., "phx_fray" -> "Phx Fray")
-        default_league = " ".join(
-            word.capitalize() for word in default_league.split("_")
-        )
+        # Convert snake_case to Title Case (e.g., "phx_fray" -> "Phx Fray"),
+        # the same way parse_filename formats stored league names
+        default_league = default_league.replace("_", " ").title()
 
     for team_name, team_stats in stats_data.get("team_stats", {}).items():
         league_name = _get_league_for_team(team_name, query_repo, default_league)
@@ -301,373 +446,191 @@ def _build_summary_from_stats_data(
 
 
 def _create_team_sheet(
-    team_name: str, team_stats: Dict[str, Any], writer: pd.ExcelWriter
+    team_name: str, team_stats: Dict[str, Any], workbook: Workbook
 ) -> None:
     """Create a sheet for team statistics."""
-    player_data = []
-
-    for player_info in team_stats.get("players", []):
-        player_data.append(
-            {
-                "Player": player_info.get(
-                    "player_name", f"Player {player_info.get('player_id', 'Unknown')}"
-                ),
-                "PA": player_info.get("plate_appearances", 0),
-                "AB": player_info.get("at_bats", 0),
-                "H": player_info.get("hits", 0),
-                "1B": player_info.get("singles", 0),
-                "2B": player_info.get("doubles", 0),
-                "3B": player_info.get("triples", 0),
-                "HR": player_info.get("home_runs", 0),
-                "BB": player_info.get("walks", 0),
-                "SF": player_info.get("sacrifice_flies", 0),
-                "RBI": player_info.get("rbis", 0),
-                "R": player_info.get("runs_scored", 0),
-                "BA": f"{player_info.get('batting_average', 0):.3f}",
-                "OBP": f"{player_info.get('on_base_percentage', 0):.3f}",
-                "SLG": f"{player_info.get('slugging_percentage', 0):.3f}",
-                "OPS": f"{player_info.get('ops', 0):.3f}",
-            }
-        )
+    player_data = [
+        _player_row(player_info, _TEAM_COUNT_COLUMNS)
+        for player_info in team_stats.get("players", [])
+    ]
 
     if player_data:
-        df = pd.DataFrame(player_data)
-        # Sort by Player name alphabetically (case-insensitive)
-        df = df.sort_values("Player", key=lambda x: x.str.lower(), ascending=True)
+        _sort_by_player(player_data)
 
         sheet_name = f"{_abbreviate_team_name(team_name)}"  # Excel sheet names limited to 31 chars
-        df.to_excel(writer, sheet_name=sheet_name, index=False)
 
         # Format the sheet
-        worksheet = writer.sheets[sheet_name]
-        worksheet.column_dimensions["A"].width = 20  # Player name
-        worksheet.column_dimensions["B"].width = 8  # PA
-        worksheet.column_dimensions["C"].width = 8  # AB
-        worksheet.column_dimensions["D"].width = 8  # H
-        worksheet.column_dimensions["E"].width = 8  # 1B
-        worksheet.column_dimensions["F"].width = 8  # 2B
-        worksheet.column_dimensions["G"].width = 8  # 3B
-        worksheet.column_dimensions["H"].width = 8  # HR
-        worksheet.column_dimensions["I"].width = 8  # BB
-        worksheet.column_dimensions["J"].width = 8  # SF
-        worksheet.column_dimensions["K"].width = 8  # RBI
-        worksheet.column_dimensions["L"].width = 8  # R
-        worksheet.column_dimensions["M"].width = 10  # BA
-        worksheet.column_dimensions["N"].width = 10  # OBP
-        worksheet.column_dimensions["O"].width = 10  # SLG
-        worksheet.column_dimensions["P"].width = 10  # OPS
+        worksheet = workbook.create_sheet(sheet_name)
+        _apply_column_widths(worksheet, player_data[0])
 
         # Add team totals row below the table with styling
-        if player_data:
-            totals_row = {
-                "Player": "TEAM TOTALS",
-                "PA": sum(player["PA"] for player in player_data),
-                "AB": sum(player["AB"] for player in player_data),
-                "H": sum(player["H"] for player in player_data),
-                "1B": sum(player["1B"] for player in player_data),
-                "2B": sum(player["2B"] for player in player_data),
-                "3B": sum(player["3B"] for player in player_data),
-                "HR": sum(player["HR"] for player in player_data),
-                "BB": sum(player["BB"] for player in player_data),
-                "SF": sum(player["SF"] for player in player_data),
-                "RBI": sum(player["RBI"] for player in player_data),
-                "R": sum(player["R"] for player in player_data),
-                "BA": f"{team_stats.get('team_batting_average', 0):.3f}",
-                "OBP": f"{team_stats.get('team_on_base_percentage', 0):.3f}",
-                "SLG": f"{team_stats.get('team_slugging_percentage', 0):.3f}",
-                "OPS": f"{team_stats.get('team_ops', 0):.3f}",
-            }
-            # Add empty separator row
-            worksheet.append([])
-            # Add totals row
-            worksheet.append(list(totals_row.values()))
-            # Apply borders to totals row to match table styling
-            thin_border = Border(
-                left=Side(style="thin"),
-                right=Side(style="thin"),
-                top=Side(style="thin"),
-                bottom=Side(style="thin"),
-            )
-            totals_row_num = worksheet.max_row
-            for col in range(1, 17):  # Columns A to P
-                cell = worksheet.cell(row=totals_row_num, column=col)
-                cell.border = thin_border
-
-        # Add autofilter to column headers (excluding totals row)
-        max_col_letter = get_column_letter(worksheet.max_column)
-        worksheet.auto_filter.ref = f"A1:{max_col_letter}{worksheet.max_row - 2}"
+        totals_row = _totals_row(player_data, team_stats, _TEAM_COUNT_COLUMNS)
+        _finalize_stat_sheet(worksheet, player_data, totals_row)
+
+
+# Legend sheet rows: abbreviation, full name, formula
+_LEGEND_HEADER = ("Abbreviation", "Full Name", "Formula")
+_LEGEND_ROWS = (
+    ("PA", "Plate Appearances", "AB + BB + SF"),
+    ("AB", "At Bats", "Total attempts - BB - SF"),
+    ("H", "Hits", "Total bases gained > 0"),
+    ("1B", "Singles", "Hits with 1 base"),
+    ("2B", "Doubles", "Hits with 2 bases"),
+    ("3B", "Triples", "Hits with 3 bases"),
+    ("HR", "Home Runs", "Hits with 4 bases"),
+    ("BB", "Walks/Bases on Balls", "Outcome = 'BB'"),
+    ("SF", "Sacrifice Flies", "Fly ball outcomes with RBI"),
+    ("HRO", "Home Run Outs", "Automatic outs from home run rule"),
+    ("RBI", "Runs Batted In", "Runs scored on play"),
+    ("R", "Runs Scored", "Runs scored by batter"),
+    ("BA", "Batting Average", "H / AB"),
+    ("OBP", "On-Base Percentage", "(H + BB + HBP + SF) / (AB + BB + HBP + SF)"),
+    ("SLG", "Slugging Percentage", "Total Bases / AB"),
+    ("OPS", "On-Base Plus Slugging", "OBP + SLG"),
+)
 
 
-def _create_legend_sheet(writer: pd.ExcelWriter) -> None:
+def _create_legend_sheet(workbook: Workbook) -> None:
     """Create a legend sheet explaining abbreviations and formulas."""
-    legend_data = [
-        {
-            "Abbreviation": "PA",
-            "Full Name": "Plate Appearances",
-            "Formula": "AB + BB + SF",
-        },
-        {
-            "Abbreviation": "AB",
-            "Full Name": "At Bats",
-            "Formula": "Total attempts - BB - SF",
-        },
-        {"Abbreviation": "H", "Full Name": "Hits", "Formula": "Total bases gained > 0"},
-        {"Abbreviation": "1B", "Full Name": "Singles", "Formula": "Hits with 1 base"},
-        {"Abbreviation": "2B", "Full Name": "Doubles", "Formula": "Hits with 2 bases"},
-        {"Abbreviation": "3B", "Full Name": "Triples", "Formula": "Hits with 3 bases"},
-        {
-            "Abbreviation": "HR",
-            "Full Name": "Home Runs",
-            "Formula": "Hits with 4 bases",
-        },
-        {
-            "Abbreviation": "BB",
-            "Full Name": "Walks/Bases on Balls",
-            "Formula": "Outcome = 'BB'",
-        },
-        {
-            "Abbreviation": "SF",
-            "Full Name": "Sacrifice Flies",
-            "Formula": "Fly ball outcomes with RBI",
-        },
-        {
-            "Abbreviation": "HRO",
-            "Full Name": "Home Run Outs",
-            "Formula": "Automatic outs from home run rule",
-        },
-        {
-            "Abbreviation": "RBI",
-            "Full Name": "Runs Batted In",
-            "Formula": "Runs scored on play",
-        },
-        {
-            "Abbreviation": "R",
-            "Full Name": "Runs Scored",
-            "Formula": "Runs scored by batter",
-        },
-        {"Abbreviation": "BA", "Full Name": "Batting Average", "Formula": "H / AB"},
-        {
-            "Abbreviation": "OBP",
-            "Full Name": "On-Base Percentage",
-            "Formula": "(H + BB + HBP + SF) / (AB + BB + HBP + SF)",
-        },
-        {
-            "Abbreviation": "SLG",
-            "Full Name": "Slugging Percentage",
-            "Formula": "Total Bases / AB",
-        },
-        {
-            "Abbreviation": "OPS",
-            "Full Name": "On-Base Plus Slugging",
-            "Formula": "OBP + SLG",
-        },
-    ]
-
-    df = pd.DataFrame(legend_data)
-    df.to_excel(writer, sheet_name="Legend", index=False)
-
     # Format the sheet
-    worksheet = writer.sheets["Legend"]
-    worksheet.column_dimensions["A"].width = 15  # Abbreviation
-    worksheet.column_dimensions["B"].width = 25  # Full Name
-    worksheet.column_dimensions["C"].width = 40  # Formula
+    worksheet = workbook.create_sheet("Legend")
+    _apply_column_widths(worksheet, _LEGEND_HEADER, _LEGEND_WIDTHS)
+    worksheet.append(_LEGEND_HEADER)
+    for row in _LEGEND_ROWS:
+        worksheet.append(row)
 
 
 def _create_player_summary_sheet(
-    query_repo: QueryRepository, writer: pd.ExcelWriter
+    query_repo: QueryRepository, workbook: Workbook
 ) -> None:
     """Create comprehensive player summary sheet with all players from all leagues/seasons, consolidated by name."""
-    from softball_statistics.repository.sqlite import SQLiteQueryRepository
-
-    aggregated_players = {}
     player_data = []
 
     if isinstance(query_repo, SQLiteQueryRepository):
-        with query_repo._get_connection() as conn:
-            cursor = conn.cursor()
-            # Get all players with their team names (but we'll aggregate by name)
-            cursor.execute(
-                """
-                SELECT p.id, p.name, t.name as team_name
-                FROM players p
-                JOIN teams t ON p.team_id = t.id
-                ORDER BY p.name
-            """
+        # Counting stats are summed per player name in SQL, across all teams
+        player_totals = query_repo.get_player_totals_by_name()
+        # Recalculate averages for every player at once
+        rate_stats = _summary_rate_stats(player_totals)
+        for totals, (ba, slg, ops) in zip(player_totals, rate_stats):
+            player_data.append(
+                {
+                    "Player": totals["name"],
+                    "PA": totals["plate_appearances"],
+                    "AB": totals["at_bats"],
+                    "H": totals["hits"],
+                    "1B": totals["singles"],
+                    "2B": totals["doubles"],
+                    "3B": totals["triples"],
+                    "HR": totals["home_runs"],
+                    "BB": totals["walks"],
+                    "SF": totals["sacrifice_flies"],
+                    "HRO": totals["home_run_outs"],
+                    "RBI": totals["rbis"],
+                    "R": totals["runs_scored"],
+                    "BA": ba,
+                    # Simplified OBP (BA approximation)
+                    "OBP": ba,
+                    "SLG": slg,
+                    "OPS": ops,
+                }
             )
 
-            players = cursor.fetchall()
-
-            for player_id, player_name, team_name in players:
-                stats = query_repo.get_player_stats(player_id)
-                if stats:
-                    if player_name not in aggregated_players:
-                        aggregated_players[player_name] = {
-                            "Player": player_name,
-                            "PA": stats.plate_appearances,
-                            "AB": stats.at_bats,
-                            "H": stats.hits,
-                            "1B": stats.singles,
-                            "2B": stats.doubles,
-                            "3B": stats.triples,
-                            "HR": stats.home_runs,
-                            "BB": stats.walks,
-                            "SF": stats.sacrifice_flies,
-                            "HRO": stats.home_run_outs,
-                            "RBI": stats.rbis,
-                            "R": stats.runs_scored,
-                            "BA": stats.batting_average,
-                            "OBP": stats.on_base_percentage,
-                            "SLG": stats.slugging_percentage,
-                            "OPS": stats.ops,
-                        }
-                    else:
-                        # Sum the stats
-                        aggregated_players[player_name]["PA"] += stats.plate_appearances
-                        aggregated_players[player_name]["AB"] += stats.at_bats
-                        aggregated_players[player_name]["H"] += stats.hits
-                        aggregated_players[player_name]["1B"] += stats.singles
-                        aggregated_players[player_name]["2B"] += stats.doubles
-                        aggregated_players[player_name]["3B"] += stats.triples
-                        aggregated_players[player_name]["HR"] += stats.home_runs
-                        aggregated_players[player_name]["BB"] += stats.walks
-                        aggregated_players[player_name]["SF"] += stats.sacrifice_flies
-                        aggregated_players[player_name]["HRO"] += stats.home_run_outs
-                        aggregated_players[player_name]["RBI"] += stats.rbis
-                        aggregated_players[player_name]["R"] += stats.runs_scored
-
-        # Recalculate derived stats after aggregation
-        player_data = []
-        for player in aggregated_players.values():
-            ab = player["AB"]
-            hits = player["H"]
-            singles = player["1B"]
-            doubles = player["2B"]
-            triples = player["3B"]
-            hr = player["HR"]
-
-            # Recalculate averages
-            player["BA"] = (
-                f"{calculate_batting_average(hits, ab):.3f}" if ab > 0 else "0.000"
-            )
-            # Simplified OBP (BA approximation)
-            player["OBP"] = player["BA"]
-            player["SLG"] = (
-                f"{calculate_slg(singles, doubles, triples, hr, ab):.3f}"
-                if ab > 0
-                else "0.000"
-            )
-            player["OPS"] = (
-                f"{calculate_ops(float(player['OBP']), float(player['SLG'])):.3f}"
-            )
-
-            player_data.append(player)
-
     if player_data:
-        df = pd.DataFrame(player_data)
-        # Sort alphabetically by player name (case-insensitive)
-        df = df.sort_values("Player", key=lambda x: x.str.lower(), ascending=True)
-
-        df.to_excel(writer, sheet_name="Player Summary", index=False)
+        # SQL already orders names ignoring ASCII case, so this pass is
+        # linear and only moves names whose case SQLite cannot fold
+        _sort_by_player(player_data)
 
         # Format the sheet
-        worksheet = writer.sheets["Player Summary"]
-        worksheet.column_dimensions["A"].width = 20  # Player name
-        worksheet.column_dimensions["B"].width = 8  # PA
-        worksheet.column_dimensions["C"].width = 8  # AB
-        worksheet.column_dimensions["D"].width = 8  # H
-        worksheet.column_dimensions["E"].width = 8  # 1B
-        worksheet.column_dimensions["F"].width = 8  # 2B
-        worksheet.column_dimensions["G"].width = 8  # 3B
-        worksheet.column_dimensions["H"].width = 8  # HR
-        worksheet.column_dimensions["I"].width = 8  # BB
-        worksheet.column_dimensions["J"].width = 8  # SF
-        worksheet.column_dimensions["K"].width = 8  # HRO
-        worksheet.column_dimensions["L"].width = 8  # RBI
-        worksheet.column_dimensions["M"].width = 8  # R
-        worksheet.column_dimensions["N"].width = 10  # BA
-        worksheet.column_dimensions["O"].width = 10  # OBP
-        worksheet.column_dimensions["P"].width = 10  # SLG
-        worksheet.column_dimensions["Q"].width = 10  # OPS
+        worksheet = workbook.create_sheet("Player Summary")
+        _apply_column_widths(worksheet, player_data[0])
 
         # Add autofilter to column headers
-        worksheet.auto_filter.ref = worksheet.dimensions
+        worksheet.auto_filter.ref = _data_range(player_data)
+        _append_rows(worksheet, player_data)
 
 
-def _get_seasons_for_team(
-    team_name: str, query_repo: Optional[QueryRepository]
-) -> list[str]:
-    """Get all seasons for a team, sorted chronologically."""
-    if not query_repo:
-        return []
-    from softball_statistics.repository.sqlite import SQLiteQueryRepository
+def _summary_rate_stats(
+    player_totals: list[Dict[str, Any]],
+) -> list[Tuple[str, str, str]]:
+    """
+    Format BA, SLG and OPS for each player's totals, computed for all at once.
 
-    if not isinstance(query_repo, SQLiteQueryRepository):
-        return []
-    with query_repo._get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT l.season, MIN(g.date) as first_game_date
-            FROM leagues l
-            JOIN teams t ON t.league_id = l.id
-            LEFT JOIN games g ON g.team_id = t.id
-            WHERE t.name = ?
-            GROUP BY l.season
-            ORDER BY first_game_date IS NULL, first_game_date DESC, l.season
-            """,
-            (team_name,),
+    Walks are left out, so OBP equals BA and OPS is calculate_ops(BA, SLG),
+    matching the sheet's simplified OBP.
+    """
+    # Imported here so exports that write no player summary skip loading numpy
+    import numpy as np
+
+    counts = np.array(
+        [
+            (
+                totals["at_bats"],
+                totals["hits"],
+                totals["singles"],
+                totals["doubles"],
+                totals["triples"],
+                totals["home_runs"],
+            )
+            for totals in player_totals
+        ],
+        dtype=np.int64,
+    ).reshape(-1, 6)
+    stats = calculate_batting_stats_batch(*counts.T, walks=0)
+    return [
+        (f"{ba:.3f}", f"{slg:.3f}", f"{ops:.3f}")
+        for ba, slg, ops in zip(
+            stats["batting_average"].tolist(),
+            stats["slugging_percentage"].tolist(),
+            stats["ops"].tolist(),
         )
-        return [row[0] for row in cursor.fetchall()]
+    ]
 
 
-def _get_league_for_team_season(
-    team_name: str, season: str, query_repo: Optional[QueryRepository]
-) -> str:
-    """Get league name for a team and season."""
-    if not query_repo:
-        return "Unknown"
-    from softball_statistics.repository.sqlite import SQLiteQueryRepository
+def _load_team_season_index(
+    query_repo: Optional[QueryRepository],
+) -> _TeamSeasonIndex:
+    """
+    Load every team's seasons, team IDs and leagues with one query.
 
+    Returns:
+        A map of team name to its seasons, newest first game first (seasons
+        without games last), and a map of (team name, season) to
+        (team ID, league name).
+    """
+    seasons_by_team: Dict[str, list[str]] = {}
+    team_seasons: Dict[Tuple[str, str], Tuple[int, str]] = {}
+    if not query_repo:
+        return seasons_by_team, team_seasons
     if not isinstance(query_repo, SQLiteQueryRepository):
-        return "Unknown"
+        return seasons_by_team, team_seasons
     with query_repo._get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
             """
-            SELECT l.name FROM leagues l
+            SELECT t.name, l.season, t.id, l.name,
+                   MIN(MIN(g.date)) OVER (PARTITION BY t.name, l.season)
+                       AS first_game_date
+            FROM leagues l
             JOIN teams t ON t.league_id = l.id
-            WHERE t.name = ? AND l.season = ?
-            LIMIT 1
-            """,
-            (team_name, season),
+            LEFT JOIN games g ON g.team_id = t.id
+            GROUP BY t.id
+            ORDER BY t.name, first_game_date IS NULL, first_game_date DESC,
+                     l.season, t.id
+            """
         )
-        row = cursor.fetchone()
-        return row[0] if row else "Unknown"
-
+        for team_name, season, team_id, league_name, _ in cursor:
+            if (team_name, season) not in team_seasons:
+                team_seasons[team_name, season] = (team_id, league_name)
+                seasons_by_team.setdefault(team_name, []).append(season)
+    return seasons_by_team, team_seasons
 
-def _get_team_id(
-    team_name: str, season: str, query_repo: Optional[QueryRepository]
-) -> Optional[int]:
-    """Get team ID for team and season."""
-    if not query_repo:
-        return None
-    from softball_statistics.repository.sqlite import SQLiteQueryRepository
 
-    if not isinstance(query_repo, SQLiteQueryRepository):
-        return None
-    with query_repo._get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT t.id FROM teams t
-            JOIN leagues l ON t.league_id = l.id
-            WHERE t.name = ? AND l.season = ?
-            LIMIT 1
-            """,
-            (team_name, season),
-        )
-        row = cursor.fetchone()
-        return row[0] if row else None
+def _get_seasons_for_team(
+    team_name: str, query_repo: Optional[QueryRepository]
+) -> list[str]:
+    """Get all seasons for a team, sorted chronologically."""
+    seasons_by_team, _ = _load_team_season_index(query_repo)
+    return seasons_by_team.get(team_name, [])
 
 
 def _get_all_teams(query_repo: Optional[QueryRepository]) -> list[str]:
@@ -675,8 +638,6 @@ def _get_all_teams(query_repo: Optional[QueryRepository]) -> list[str]:
     if not query_repo:
         return []
 
-    from softball_statistics.repository.sqlite import SQLiteQueryRepository
-
     if not isinstance(query_repo, SQLiteQueryRepository):
         return []
 
@@ -698,8 +659,6 @@ def _get_league_for_team(
     if not query_repo:
         return default_league
 
-    from softball_statistics.repository.sqlite import SQLiteQueryRepository
-
     if not isinstance(query_repo, SQLiteQueryRepository):
         return default_league
 
@@ -719,339 +678,127 @@ def _get_league_for_team(
 
 
 def _create_cumulative_team_sheet(
-    team_name: str, cumulative_stats: Dict[str, Any], writer: pd.ExcelWriter
+    team_name: str, cumulative_stats: Dict[str, Any], workbook: Workbook
 ) -> None:
     """Create cumulative team sheet across all seasons."""
-    player_data = []
-
-    for player_info in cumulative_stats.get("players", []):
-        player_data.append(
-            {
-                "Player": player_info.get(
-                    "player_name", f"Player {player_info.get('player_id', 'Unknown')}"
-                ),
-                "PA": player_info.get("plate_appearances", 0),
-                "AB": player_info.get("at_bats", 0),
-                "H": player_info.get("hits", 0),
-                "1B": player_info.get("singles", 0),
-                "2B": player_info.get("doubles", 0),
-                "3B": player_info.get("triples", 0),
-                "HR": player_info.get("home_runs", 0),
-                "BB": player_info.get("walks", 0),
-                "SF": player_info.get("sacrifice_flies", 0),
-                "HRO": player_info.get("home_run_outs", 0),
-                "RBI": player_info.get("rbis", 0),
-                "R": player_info.get("runs_scored", 0),
-                "BA": f"{player_info.get('batting_average', 0):.3f}",
-                "OBP": f"{player_info.get('on_base_percentage', 0):.3f}",
-                "SLG": f"{player_info.get('slugging_percentage', 0):.3f}",
-                "OPS": f"{player_info.get('ops', 0):.3f}",
-            }
-        )
+    player_data = [
+        _player_row(player_info) for player_info in cumulative_stats.get("players", [])
+    ]
 
     if player_data:
-        df = pd.DataFrame(player_data)
-        # Sort by Player name alphabetically (case-insensitive)
-        df = df.sort_values("Player", key=lambda x: x.str.lower(), ascending=True)
+        _sort_by_player(player_data)
 
         sheet_name = f"{_abbreviate_team_name(team_name)} Total"
-        df.to_excel(writer, sheet_name=sheet_name, index=False)
 
         # Format the sheet
-        worksheet = writer.sheets[sheet_name]
+        worksheet = workbook.create_sheet(sheet_name)
         worksheet.sheet_properties.tabColor = "FF0000FF"  # Blue for cumulative
-        worksheet.column_dimensions["A"].width = 20  # Player name
-        worksheet.column_dimensions["B"].width = 8  # PA
-        worksheet.column_dimensions["C"].width = 8  # AB
-        worksheet.column_dimensions["D"].width = 8  # H
-        worksheet.column_dimensions["E"].width = 8  # 1B
-        worksheet.column_dimensions["F"].width = 8  # 2B
-        worksheet.column_dimensions["G"].width = 8  # 3B
-        worksheet.column_dimensions["H"].width = 8  # HR
-        worksheet.column_dimensions["I"].width = 8  # BB
-        worksheet.column_dimensions["J"].width = 8  # SF
-        worksheet.column_dimensions["K"].width = 8  # HRO
-        worksheet.column_dimensions["L"].width = 8  # RBI
-        worksheet.column_dimensions["M"].width = 8  # R
-        worksheet.column_dimensions["N"].width = 10  # BA
-        worksheet.column_dimensions["O"].width = 10  # OBP
-        worksheet.column_dimensions["P"].width = 10  # SLG
-        worksheet.column_dimensions["Q"].width = 10  # OPS
+        _apply_column_widths(worksheet, player_data[0])
 
         # Add team totals row
         team_totals = cumulative_stats.get("team_totals", {})
-        totals_row = {
-            "Player": "TEAM TOTALS",
-            "PA": sum(player["PA"] for player in player_data),
-            "AB": sum(player["AB"] for player in player_data),
-            "H": sum(player["H"] for player in player_data),
-            "1B": sum(player["1B"] for player in player_data),
-            "2B": sum(player["2B"] for player in player_data),
-            "3B": sum(player["3B"] for player in player_data),
-            "HR": sum(player["HR"] for player in player_data),
-            "BB": sum(player["BB"] for player in player_data),
-            "SF": sum(player["SF"] for player in player_data),
-            "HRO": sum(player["HRO"] for player in player_data),
-            "RBI": sum(player["RBI"] for player in player_data),
-            "R": sum(player["R"] for player in player_data),
-            "BA": f"{team_totals.get('team_batting_average', 0):.3f}",
-            "OBP": f"{team_totals.get('team_on_base_percentage', 0):.3f}",
-            "SLG": f"{team_totals.get('team_slugging_percentage', 0):.3f}",
-            "OPS": f"{team_totals.get('team_ops', 0):.3f}",
-        }
-        worksheet.append([])
-        worksheet.append(list(totals_row.values()))
-        thin_border = Border(
-            left=Side(style="thin"),
-            right=Side(style="thin"),
-            top=Side(style="thin"),
-            bottom=Side(style="thin"),
-        )
-        totals_row_num = worksheet.max_row
-        num_cols = len(totals_row)
-        for col in range(1, num_cols + 1):
-            cell = worksheet.cell(row=totals_row_num, column=col)
-            cell.border = thin_border
-
-        # Add autofilter
-        max_col_letter = get_column_letter(worksheet.max_column)
-        worksheet.auto_filter.ref = f"A1:{max_col_letter}{worksheet.max_row - 2}"
+        totals_row = _totals_row(player_data, team_totals)
+        _finalize_stat_sheet(worksheet, player_data, totals_row)
 
 
 def _create_season_total_sheet(
-    team_name: str, season: str, season_stats: Dict[str, Any], writer: pd.ExcelWriter
+    team_name: str, season: str, season_stats: Dict[str, Any], workbook: Workbook
 ) -> None:
     """Create season total sheet."""
     team_stats = season_stats.get("team_stats", {}).get(team_name, {})
-    player_data = []
-
-    for player_info in team_stats.get("players", []):
-        player_data.append(
-            {
-                "Player": player_info.get(
-                    "player_name", f"Player {player_info.get('player_id', 'Unknown')}"
-                ),
-                "PA": player_info.get("plate_appearances", 0),
-                "AB": player_info.get("at_bats", 0),
-                "H": player_info.get("hits", 0),
-                "1B": player_info.get("singles", 0),
-                "2B": player_info.get("doubles", 0),
-                "3B": player_info.get("triples", 0),
-                "HR": player_info.get("home_runs", 0),
-                "BB": player_info.get("walks", 0),
-                "SF": player_info.get("sacrifice_flies", 0),
-                "HRO": player_info.get("home_run_outs", 0),
-                "RBI": player_info.get("rbis", 0),
-                "R": player_info.get("runs_scored", 0),
-                "BA": f"{player_info.get('batting_average', 0):.3f}",
-                "OBP": f"{player_info.get('on_base_percentage', 0):.3f}",
-                "SLG": f"{player_info.get('slugging_percentage', 0):.3f}",
-                "OPS": f"{player_info.get('ops', 0):.3f}",
-            }
-        )
+    player_data = [
+        _player_row(player_info) for player_info in team_stats.get("players", [])
+    ]
 
     if player_data:
-        df = pd.DataFrame(player_data)
-        df = df.sort_values("Player", key=lambda x: x.str.lower(), ascending=True)
+        _sort_by_player(player_data)
 
         sheet_name = f"{_abbreviate_team_name(team_name)} {season} Total"
-        df.to_excel(writer, sheet_name=sheet_name, index=False)
 
         # Format
-        worksheet = writer.sheets[sheet_name]
+        worksheet = workbook.create_sheet(sheet_name)
         worksheet.sheet_properties.tabColor = "FF00FF00"  # Green for season totals
-        for col, width in [
-            ("A", 20),
-            ("B", 8),
-            ("C", 8),
-            ("D", 8),
-            ("E", 8),
-            ("F", 8),
-            ("G", 8),
-            ("H", 8),
-            ("I", 8),
-            ("J", 8),
-            ("K", 8),
-            ("L", 8),
-            ("M", 8),
-            ("N", 10),
-            ("O", 10),
-            ("P", 10),
-            ("Q", 10),
-        ]:
-            worksheet.column_dimensions[col].width = width
+        _apply_column_widths(worksheet, player_data[0])
 
         # Add totals
-        team_totals = team_stats
-        totals_row = {
-            "Player": "TEAM TOTALS",
-            "PA": sum(player["PA"] for player in player_data),
-            "AB": sum(player["AB"] for player in player_data),
-            "H": sum(player["H"] for player in player_data),
-            "1B": sum(player["1B"] for player in player_data),
-            "2B": sum(player["2B"] for player in player_data),
-            "3B": sum(player["3B"] for player in player_data),
-            "HR": sum(player["HR"] for player in player_data),
-            "BB": sum(player["BB"] for player in player_data),
-            "SF": sum(player["SF"] for player in player_data),
-            "HRO": sum(player["HRO"] for player in player_data),
-            "RBI": sum(player["RBI"] for player in player_data),
-            "R": sum(player["R"] for player in player_data),
-            "BA": f"{team_totals.get('team_batting_average', 0):.3f}",
-            "OBP": f"{team_totals.get('team_on_base_percentage', 0):.3f}",
-            "SLG": f"{team_totals.get('team_slugging_percentage', 0):.3f}",
-            "OPS": f"{team_totals.get('team_ops', 0):.3f}",
-        }
-        worksheet.append([])
-        worksheet.append(list(totals_row.values()))
-        thin_border = Border(
-            left=Side(style="thin"),
-            right=Side(style="thin"),
-            top=Side(style="thin"),
-            bottom=Side(style="thin"),
-        )
-        totals_row_num = worksheet.max_row
-        num_cols = len(totals_row)
-        for col in range(1, num_cols + 1):
-            cell = worksheet.cell(row=totals_row_num, column=col)
-            cell.border = thin_border
-
-        worksheet.auto_filter.ref = (
-            f"A1:{get_column_letter(worksheet.max_column)}{worksheet.max_row - 2}"
-        )
+        totals_row = _totals_row(player_data, team_stats)
+        _finalize_stat_sheet(worksheet, player_data, totals_row)
 
 
 def _create_per_game_sheet(
     team_name: str,
     game_stat: Dict[str, Any],
     player_stats: list[Dict[str, Any]],
-    writer: pd.ExcelWriter,
+    workbook: Workbook,
 ) -> None:
     """Create per-game sheet with player-by-player stats."""
-    player_data = []
-
-    for player_info in player_stats:
-        player_data.append(
-            {
-                "Player": player_info.get(
-                    "player_name", f"Player {player_info.get('player_id', 'Unknown')}"
-                ),
-                "PA": player_info.get("plate_appearances", 0),
-                "AB": player_info.get("at_bats", 0),
-                "H": player_info.get("hits", 0),
-                "1B": player_info.get("singles", 0),
-                "2B": player_info.get("doubles", 0),
-                "3B": player_info.get("triples", 0),
-                "HR": player_info.get("home_runs", 0),
-                "BB": player_info.get("walks", 0),
-                "SF": player_info.get("sacrifice_flies", 0),
-                "HRO": player_info.get("home_run_outs", 0),
-                "RBI": player_info.get("rbis", 0),
-                "R": player_info.get("runs_scored", 0),
-                "BA": f"{player_info.get('batting_average', 0):.3f}",
-                "OBP": f"{player_info.get('on_base_percentage', 0):.3f}",
-                "SLG": f"{player_info.get('slugging_percentage', 0):.3f}",
-                "OPS": f"{player_info.get('ops', 0):.3f}",
-            }
-        )
+    player_data = [_player_row(player_info) for player_info in player_stats]
 
     if player_data:
-        df = pd.DataFrame(player_data)
-        df = df.sort_values("Player", key=lambda x: x.str.lower(), ascending=True)
+        _sort_by_player(player_data)
 
         sheet_name = f"{_abbreviate_team_name(team_name)} {game_stat.get('season', 'Unknown')} Game {game_stat.get('game_number', 0)}"
-        df.to_excel(writer, sheet_name=sheet_name, index=False)
 
         # Format
-        worksheet = writer.sheets[sheet_name]
+        worksheet = workbook.create_sheet(sheet_name)
         worksheet.sheet_properties.tabColor = "FFFFFF00"  # Yellow for per-game
-        for col, width in [
-            ("A", 20),  # Player
-            ("B", 8),  # PA
-            ("C", 8),  # AB
-            ("D", 8),  # H
-            ("E", 8),  # 1B
-            ("F", 8),  # 2B
-            ("G", 8),  # 3B
-            ("H", 8),  # HR
-            ("I", 8),  # BB
-            ("J", 8),  # SF
-            ("K", 8),  # HRO
-            ("L", 8),  # RBI
-            ("M", 8),  # R
-            ("N", 10),  # BA
-            ("O", 10),  # OBP
-            ("P", 10),  # SLG
-            ("Q", 10),  # OPS
-        ]:
-            worksheet.column_dimensions[col].width = width
-
-        # Calculate team totals from player data
-        if player_data:
-            totals_row = {
-                "Player": "TEAM TOTALS",
-                "PA": sum(player["PA"] for player in player_data),
-                "AB": sum(player["AB"] for player in player_data),
-                "H": sum(player["H"] for player in player_data),
-                "1B": sum(player["1B"] for player in player_data),
-                "2B": sum(player["2B"] for player in player_data),
-                "3B": sum(player["3B"] for player in player_data),
-                "HR": sum(player["HR"] for player in player_data),
-                "BB": sum(player["BB"] for player in player_data),
-                "SF": sum(player["SF"] for player in player_data),
-                "HRO": sum(player["HRO"] for player in player_data),
-                "RBI": sum(player["RBI"] for player in player_data),
-                "R": sum(player["R"] for player in player_data),
-                "BA": f"{calculate_batting_average(sum(player['H'] for player in player_data), sum(player['AB'] for player in player_data)):.3f}",
-                "OBP": f"{calculate_batting_average(sum(player['H'] for player in player_data), sum(player['AB'] for player in player_data)):.3f}",  # Simplified
-                "SLG": f"{calculate_slg(sum(player['1B'] for player in player_data), sum(player['2B'] for player in player_data), sum(player['3B'] for player in player_data), sum(player['HR'] for player in player_data), sum(player['AB'] for player in player_data)):.3f}",
-                "OPS": f"{calculate_ops(calculate_batting_average(sum(player['H'] for player in player_data), sum(player['AB'] for player in player_data)), calculate_slg(sum(player['1B'] for player in player_data), sum(player['2B'] for player in player_data), sum(player['3B'] for player in player_data), sum(player['HR'] for player in player_data), sum(player['AB'] for player in player_data))):.3f}",
-            }
-            worksheet.append([])
-            worksheet.append(list(totals_row.values()))
-            thin_border = Border(
-                left=Side(style="thin"),
-                right=Side(style="thin"),
-                top=Side(style="thin"),
-                bottom=Side(style="thin"),
-            )
-            totals_row_num = worksheet.max_row
-            num_cols = len(totals_row)
-            for col in range(1, num_cols + 1):
-                cell = worksheet.cell(row=totals_row_num, column=col)
-                cell.border = thin_border
-
-        worksheet.auto_filter.ref = (
-            f"A1:{get_column_letter(worksheet.max_column)}{worksheet.max_row - 2}"
+        _apply_column_widths(worksheet, player_data[0])
+
+        # Calculate team totals from player data; rate stats reuse the
+        # column totals rather than re-summing
+        totals = _column_totals(player_data, _COUNT_COLUMNS)
+        at_bats = totals["AB"]
+        ba = calculate_batting_average(totals["H"], at_bats)
+        slg = calculate_slg(
+            totals["1B"], totals["2B"], totals["3B"], totals["HR"], at_bats
         )
+        totals_row = {
+            "Player": "TEAM TOTALS",
+            **totals,
+            "BA": f"{ba:.3f}",
+            "OBP": f"{ba:.3f}",  # Simplified
+            "SLG": f"{slg:.3f}",
+            "OPS": f"{calculate_ops(ba, slg):.3f}",
+        }
+        _finalize_stat_sheet(worksheet, player_data, totals_row)
 
 
-def _create_player_sheet(player_stats: PlayerStats, writer: pd.ExcelWriter) -> None:
-    """Create detailed player sheet (optional)."""
-    # For now, just create a simple summary
+def _create_player_details_sheet(
+    team_stats_by_name: Dict[str, Any], workbook: Workbook
+) -> None:
+    """Create one player details sheet with a block of rows per player."""
+    # For now, just a simple summary per player
     # In the future, this could include game-by-game breakdowns
-    data = [
-        {
-            "Statistic": "Games Played",
-            "Value": "TBD",  # Would need to track this in PlayerStats
-        },
-        {"Statistic": "At Bats", "Value": player_stats.at_bats},
-        {"Statistic": "Hits", "Value": player_stats.hits},
-        {
-            "Statistic": "Batting Average",
-            "Value": f"{player_stats.batting_average:.3f}",
-        },
-        {
-            "Statistic": "On Base Percentage",
-            "Value": f"{player_stats.on_base_percentage:.3f}",
-        },
-        {
-            "Statistic": "Slugging Percentage",
-            "Value": f"{player_stats.slugging_percentage:.3f}",
-        },
-        {"Statistic": "OPS", "Value": f"{player_stats.ops:.3f}"},
-    ]
+    rows = []
+    for team_name, team_stats in team_stats_by_name.items():
+        for player_stats in team_stats.get("players", []):
+            player_name = player_stats.get("player_name", "Unknown")
+            rows.extend(
+                (team_name, player_name, statistic, value)
+                for statistic, value in (
+                    ("Games Played", "TBD"),  # Would need to track this per player
+                    ("At Bats", player_stats.get("at_bats", 0)),
+                    ("Hits", player_stats.get("hits", 0)),
+                    (
+                        "Batting Average",
+                        f"{player_stats.get('batting_average', 0):.3f}",
+                    ),
+                    (
+                        "On Base Percentage",
+                        f"{player_stats.get('on_base_percentage', 0):.3f}",
+                    ),
+                    (
+                        "Slugging Percentage",
+                        f"{player_stats.get('slugging_percentage', 0):.3f}",
+                    ),
+                    ("OPS", f"{player_stats.get('ops', 0):.3f}"),
+                )
+            )
 
-    df = pd.DataFrame(data)
-    sheet_name = f"Player_{player_stats.player_id}_detail"
-    df.to_excel(writer, sheet_name=sheet_name, index=False)
+    if rows:
+        worksheet = workbook.create_sheet("Player Details")
+        _apply_column_widths(worksheet, _PLAYER_DETAILS_HEADER, _PLAYER_DETAILS_WIDTHS)
+        worksheet.auto_filter.ref = f"A1:D{len(rows) + 1}"
+        worksheet.append(_PLAYER_DETAILS_HEADER)
+        for row in rows:
+            worksheet.append(row)
@@ -4,7 +4,7 @@ Interfaces for dependency injection.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Protocol
+from typing import Any, ContextManager, Dict, Iterator, Optional, Protocol
 
 from softball_statistics.models import League, Team
 
@@ -42,6 +42,15 @@ class CommandRepository(Protocol):
     def delete_game_data(self, league: str, team: str, season: str, game: str) -> None:
         ...
 
+    def save_parsed_batch(self, batch: list) -> None:
+        ...
+
+    def clear_all_data(self) -> None:
+        ...
+
+    def session(self) -> ContextManager[None]:
+        ...
+
 
 class QueryRepository(Protocol):
     """Protocol for query operations (reads)."""
@@ -52,12 +61,27 @@ class QueryRepository(Protocol):
     def list_leagues(self) -> list[League]:
         ...
 
+    def find_league(self, name: str, season: str) -> Optional[League]:
+        ...
+
+    def find_team(self, league_id: int, name: str) -> Optional[Team]:
+        ...
+
     def list_teams_by_league(self, league_id: int) -> list[Team]:
         ...
 
     def get_player_stats(self, player_id: int) -> Any:
         ...
 
+    def get_team_player_stats(self, team_id: int) -> list[Dict[str, Any]]:
+        ...
+
+    def iter_team_player_stats(self, team_id: int) -> Iterator[Dict[str, Any]]:
+        ...
+
+    def get_player_totals_by_name(self) -> list[Dict[str, Any]]:
+        ...
+
 
 class Repository(CommandRepository, QueryRepository, Protocol):
     """Combined repository protocol for backwards compatibility."""
@@ -1,9 +1,13 @@
+import sys
 from dataclasses import dataclass
 from datetime import date
 from typing import Optional
 
+# Slotted instances carry no per-instance __dict__; slots=True needs 3.10+
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class League:
     """Represents a softball league."""
 
@@ -16,7 +20,7 @@ class League:
             raise ValueError("League name and season are required")
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Team:
     """Represents a team within a league."""
 
@@ -31,7 +35,7 @@ class Team:
             raise ValueError("league_id must be positive if provided")
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Player:
     """Represents a player on a team."""
 
@@ -46,7 +50,7 @@ class Player:
             raise ValueError("team_id must be positive if provided")
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Week:
     """Represents a week within a league season."""
 
@@ -65,7 +69,7 @@ class Week:
             raise ValueError("league_id must be positive if provided")
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Game:
     """Represents a game within a week."""
 
@@ -83,7 +87,7 @@ class Game:
             raise ValueError("team_id must be positive if provided")
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PlateAppearance:
     """Represents a single plate appearance."""
 
@@ -108,7 +112,7 @@ class PlateAppearance:
             raise ValueError("RBIs and runs scored cannot be negative")
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PlayerStats:
     """Calculated statistics for a player."""
 
@@ -133,19 +137,27 @@ class PlayerStats:
     def __post_init__(self):
         if self.player_id < 1:
             raise ValueError("Valid player_id is required")
-        for field in [
-            "at_bats",
-            "hits",
-            "singles",
-            "doubles",
-            "triples",
-            "home_runs",
-            "rbis",
-            "runs_scored",
-            "plate_appearances",
-            "walks",
-            "sacrifice_flies",
-            "home_run_outs",
-        ]:
-            if getattr(self, field) < 0:
-                raise ValueError(f"{field} cannot be negative")
+        if self.at_bats < 0:
+            raise ValueError("at_bats cannot be negative")
+        if self.hits < 0:
+            raise ValueError("hits cannot be negative")
+        if self.singles < 0:
+            raise ValueError("singles cannot be negative")
+        if self.doubles < 0:
+            raise ValueError("doubles cannot be negative")
+        if self.triples < 0:
+            raise ValueError("triples cannot be negative")
+        if self.home_runs < 0:
+            raise ValueError("home_runs cannot be negative")
+        if self.rbis < 0:
+            raise ValueError("rbis cannot be negative")
+        if self.runs_scored < 0:
+            raise ValueError("runs_scored cannot be negative")
+        if self.plate_appearances < 0:
+            raise ValueError("plate_appearances cannot be negative")
+        if self.walks < 0:
+            raise ValueError("walks cannot be negative")
+        if self.sacrifice_flies < 0:
+            raise ValueError("sacrifice_flies cannot be negative")
+        if self.home_run_outs < 0:
+            raise ValueError("home_run_outs cannot be negative")
@@ -1,5 +1,33 @@
 import re
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Tuple
+
+# Out notation patterns, compiled once at import
+_FLY_BALL_RE = re.compile(r"^f(?:10|[1-9])(?:-(?:10|[1-9]))*$")
+_GROUND_BALL_RE = re.compile(r"^(\d+(?:-\d+)+)$")
+_SIMPLE_FIELDING_RE = re.compile(r"^\d$")
+_OTHER_OUT_RE = re.compile(r"^[a-z](\d+)$")
+
+# Fixed notations mapped to (hit_type, bases)
+_NOTATIONS = {
+    "1b": ("single", 1),
+    "2b": ("double", 2),
+    "3b": ("triple", 3),
+    "hr": ("home_run", 4),
+    "k": ("out", 0),  # Strikeout is an out
+    "o": ("out", 0),  # Out
+    "bb": ("walk", 0),
+    # Special cases for outs
+    "hpo": ("out", 0),
+    "fo": ("out", 0),
+    "hro": ("out", 0),
+    "if": ("out", 0),
+}
+
+# Fielding positions allowed after "f" in fly ball notation, and the letters
+# that may prefix a position in other out notation
+_FLY_BALL_POSITIONS = frozenset(str(position) for position in range(1, 11))
+_OUT_LETTERS = frozenset("abcdefghijklmnopqrstuvwxyz")
 
 
 class AttemptParseError(Exception):
@@ -26,6 +54,45 @@ def parse_attempt(
     Returns:
         Dictionary with keys: 'hit_type', 'bases', 'rbis', 'runs_scored', 'warnings'
 
+    Raises:
+        AttemptParseError: If attempt string is invalid
+    """
+    attempt, hit_type, bases, rbis, runs_scored, solo_hr = _parse_notation(attempt)
+
+    # Special HR handling: solo HRs were auto-corrected
+    warnings = []
+    if solo_hr:
+        warnings.append(
+            {
+                "player_name": player_name,
+                "row_num": row_num,
+                "col_num": col_num,
+                "filename": filename,
+                "original_attempt": attempt,
+                "assumption": "HR solo (assumed 1 RBI, 1 run scored)",
+            }
+        )
+
+    return {
+        "hit_type": hit_type,
+        "bases": bases,
+        "rbis": rbis,
+        "runs_scored": runs_scored,
+        "warnings": warnings,
+    }
+
+
+@lru_cache(maxsize=1024)
+def _parse_notation(attempt: str) -> Tuple[str, str, int, int, int, bool]:
+    """
+    Parse an attempt string without the context of where it was recorded.
+
+    Scoresheets repeat a handful of notations, so results are cached.
+
+    Returns:
+        Tuple of (normalized attempt, hit_type, bases, rbis, runs_scored,
+        solo_hr), where solo_hr marks a home run auto-corrected to solo
+
     Raises:
         AttemptParseError: If attempt string is invalid
     """
@@ -38,17 +105,6 @@ def parse_attempt(
     if not attempt:
         raise AttemptParseError("Attempt string cannot be only whitespace")
 
-    # Define hit type mappings
-    hit_types = {
-        "1b": ("single", 1),
-        "2b": ("double", 2),
-        "3b": ("triple", 3),
-        "hr": ("home_run", 4),
-    }
-
-    # Special cases for outs
-    special_outs = ["hpo", "fo", "hro", "if"]
-
     # Count modifiers
     rbis = attempt.count("*")
     runs_scored = attempt.count("+")
@@ -57,23 +113,16 @@ def parse_attempt(
     base_attempt = attempt.replace("*", "").replace("+", "")
 
     # Parse the base attempt
-    if base_attempt in hit_types:
-        hit_type, bases = hit_types[base_attempt]
-    elif base_attempt == "k":
-        hit_type, bases = "out", 0  # Strikeout is an out
-    elif base_attempt == "o":
-        hit_type, bases = "out", 0  # Out
-    elif base_attempt == "bb":
-        hit_type, bases = "walk", 0
-    elif base_attempt in special_outs:
-        hit_type, bases = "out", 0
+    notation = _NOTATIONS.get(base_attempt)
+    if notation is not None:
+        hit_type, bases = notation
     elif _is_out_notation(base_attempt):
         hit_type, bases = "out", 0
     else:
         raise AttemptParseError(f"Unknown attempt notation: '{base_attempt}'")
 
     # Special HR handling
-    warnings = []
+    solo_hr = False
     if base_attempt == "hr":
         if rbis > 4:
             raise AttemptParseError(
@@ -84,66 +133,37 @@ def parse_attempt(
         if rbis == 0:
             rbis = 1
             runs_scored = max(runs_scored, 1)
-            warning_msg = f"ASSUMPTION: Player '{player_name}' HR solo"
-            if row_num and col_num and filename:
-                warning_msg += f" (row {row_num}, column {col_num} in {filename})"
-            warnings.append(
-                {
-                    "player_name": player_name,
-                    "row_num": row_num,
-                    "col_num": col_num,
-                    "filename": filename,
-                    "original_attempt": attempt,
-                    "assumption": "HR solo (assumed 1 RBI, 1 run scored)",
-                }
-            )
+            solo_hr = True
         elif rbis == 1 and runs_scored == 0:
             runs_scored = 1
-            warning_msg = f"ASSUMPTION: Player '{player_name}' HR solo"
-            if row_num and col_num and filename:
-                warning_msg += f" (row {row_num}, column {col_num} in {filename})"
-            warnings.append(
-                {
-                    "player_name": player_name,
-                    "row_num": row_num,
-                    "col_num": col_num,
-                    "filename": filename,
-                    "original_attempt": attempt,
-                    "assumption": "HR solo (assumed 1 RBI, 1 run scored)",
-                }
-            )
+            solo_hr = True
 
     # Check for invalid consecutive same modifiers (2+ in a row)
     # Skip this check for HR since HR**** is valid (4 RBIs)
     # Only reject consecutive + modifiers, allow consecutive * for multiple RBIs
-    if base_attempt != "hr" and re.search(r"\+{2,}", attempt):
+    if base_attempt != "hr" and runs_scored > 1 and "++" in attempt:
         raise AttemptParseError(f"Invalid consecutive same modifiers in '{attempt}'")
 
-    # Limit total modifiers to reasonable amounts
-    if attempt.count("*") > 4 or attempt.count("+") > 4:
+    # Limit total modifiers to reasonable amounts; the solo HR correction
+    # only ever raises counts to 1, so the counts from above still apply
+    if rbis > 4 or runs_scored > 4:
         raise AttemptParseError(
             f"Too many modifiers in '{attempt}' (max 4 of each type)"
         )
 
-    return {
-        "hit_type": hit_type,
-        "bases": bases,
-        "rbis": rbis,
-        "runs_scored": runs_scored,
-        "warnings": warnings,
-    }
+    return attempt, hit_type, bases, rbis, runs_scored, solo_hr
 
 
 def _is_fly_ball(attempt: str) -> bool:
     """Check if attempt is a fly ball (F1-F10), including double/triple plays."""
     attempt = attempt.lower()
-    return re.match(r"^f(?:10|[1-9])(?:-(?:10|[1-9]))*$", attempt) is not None
+    return _FLY_BALL_RE.match(attempt) is not None
 
 
 def _is_ground_ball(attempt: str) -> bool:
     """Check if attempt is a ground ball (e.g., 5-1, 4-6-3)."""
     attempt = attempt.lower()
-    match = re.match(r"^(\d+(?:-\d+)+)$", attempt)
+    match = _GROUND_BALL_RE.match(attempt)
     if match:
         positions = [int(p) for p in attempt.split("-")]
         return all(1 <= p <= 10 for p in positions)
@@ -153,7 +173,7 @@ def _is_ground_ball(attempt: str) -> bool:
 def _is_simple_fielding(attempt: str) -> bool:
     """Check if attempt is simple fielding position (1-10)."""
     attempt = attempt.lower()
-    match = re.match(r"^\d$", attempt)
+    match = _SIMPLE_FIELDING_RE.match(attempt)
     if match:
         return 1 <= int(attempt) <= 10
     return False
@@ -162,7 +182,7 @@ def _is_simple_fielding(attempt: str) -> bool:
 def _is_other_out(attempt: str) -> bool:
     """Check if attempt is other out notation (letter + 1-10)."""
     attempt = attempt.lower()
-    match = re.match(r"^[a-z](\d+)$", attempt)
+    match = _OTHER_OUT_RE.match(attempt)
     return match is not None and len(attempt) <= 3 and 1 <= int(match.group(1)) <= 10
 
 
@@ -175,10 +195,33 @@ def _is_out_notation(attempt: str) -> bool:
     - Ground balls: number-number (5-1, 6-4, 10-1, 4-6-3, etc.) - positions 1-10
     - Other common out notations: A1, P3, etc. - positions 1-10
     - Simple fielding positions: single digit 1-10 (4, 8, etc.) - assumed to be fly balls
+
+    Expects a lowercase attempt, as parse_attempt passes, and accepts exactly
+    what the _is_* checks above accept together, without running a regex.
     """
+    if not attempt:
+        return False
+
+    if "-" in attempt:
+        positions = attempt.split("-")
+        if attempt[0] == "f":
+            # Fly ball double/triple play: f6-4, f10-4-3
+            positions[0] = positions[0][1:]
+            return all(position in _FLY_BALL_POSITIONS for position in positions)
+        # Ground ball: 5-1, 4-6-3, 10-1
+        return all(
+            position.isdecimal() and 1 <= int(position) <= 10 for position in positions
+        )
+
+    if len(attempt) == 1:
+        # Simple fielding position: 1-9
+        return attempt.isdecimal() and int(attempt) >= 1
+
+    # Letter plus position: f4, f10, a1, p3 (fly balls are "f" plus position)
+    position = attempt[1:]
     return (
-        _is_fly_ball(attempt)
-        or _is_ground_ball(attempt)
-        or _is_simple_fielding(attempt)
-        or _is_other_out(attempt)
+        len(attempt) <= 3
+        and attempt[0] in _OUT_LETTERS
+        and position.isdecimal()
+        and 1 <= int(position) <= 10
     )
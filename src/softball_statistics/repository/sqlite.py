@@ -3,8 +3,9 @@ SQLite implementation of the repository interface.
 """
 
 import sqlite3
+from contextlib import contextmanager
 from datetime import date
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from softball_statistics.calculators.stats_calculator import calculate_batting_stats
 from softball_statistics.interfaces import CommandRepository, QueryRepository
@@ -18,6 +19,33 @@ from softball_statistics.models import (
     Week,
 )
 
+# Plate appearances tagged with how get_player_stats counts them: walk,
+# strikeout, home_run_out, hit, sacrifice_fly (an F* out with RBIs) or out
+_CLASSIFIED_PLATE_APPEARANCES = """
+    SELECT player_id, bases, rbis, runs_scored,
+           CASE
+               WHEN lower(outcome) LIKE 'bb%' THEN 'walk'
+               WHEN lower(outcome) = 'k' THEN 'strikeout'
+               WHEN lower(outcome) = 'hro' THEN 'home_run_out'
+               WHEN bases > 0 THEN 'hit'
+               WHEN rbis > 0 AND substr(outcome, 1, 1) = 'F' THEN 'sacrifice_fly'
+               ELSE 'out'
+           END AS kind
+    FROM plate_appearances
+"""
+
+
+# Every table, children before the tables they reference
+_TABLES_IN_DELETE_ORDER = (
+    "parsing_warnings",
+    "plate_appearances",
+    "games",
+    "players",
+    "weeks",
+    "teams",
+    "leagues",
+)
+
 
 class SQLiteCommandRepository(CommandRepository):
     """SQLite implementation for command operations (writes)."""
@@ -126,6 +154,20 @@ class SQLiteCommandRepository(CommandRepository):
             """
             )
 
+            # Stats queries look plate appearances up by player and by game
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_plate_appearances_player_id
+                ON plate_appearances(player_id)
+                """
+            )
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_plate_appearances_game_id
+                ON plate_appearances(game_id)
+                """
+            )
+
     def _get_connection(self):
         """Get database connection."""
         return sqlite3.connect(self.db_path)
@@ -266,6 +308,28 @@ class SQLiteQueryRepository(QueryRepository):
                 for row in cursor.fetchall()
             ]
 
+    def find_league(self, name: str, season: str) -> Optional[League]:
+        """Find a league by its name and season."""
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT id, name, season FROM leagues WHERE name = ? AND season = ? LIMIT 1",
+                (name, season),
+            ).fetchone()
+            if row:
+                return League(id=row[0], name=row[1], season=row[2])
+            return None
+
+    def find_team(self, league_id: int, name: str) -> Optional[Team]:
+        """Find a team by its league and name."""
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT id, league_id, name FROM teams WHERE league_id = ? AND name = ? LIMIT 1",
+                (league_id, name),
+            ).fetchone()
+            if row:
+                return Team(id=row[0], league_id=row[1], name=row[2])
+            return None
+
     def list_teams_by_league(self, league_id: int) -> List[Team]:
         """List teams in a league."""
         with self._get_connection() as conn:
@@ -279,17 +343,179 @@ class SQLiteQueryRepository(QueryRepository):
                 for row in cursor.fetchall()
             ]
 
-    def get_player_stats(self, player_id: int) -> Optional[PlayerStats]:
-        """Get player statistics."""
+    def list_all_teams(self) -> List[Team]:
+        """List teams in every league, ordered by league name, season and team name."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT t.id, t.league_id, t.name FROM teams t
+                JOIN leagues l ON t.league_id = l.id
+                ORDER BY l.name, l.season, t.name
+                """
+            )
+            return [
+                Team(id=row[0], league_id=row[1], name=row[2])
+                for row in cursor.fetchall()
+            ]
 
-            # Get all attempts for this player
+    def get_team_player_stats(self, team_id: int) -> List[Dict[str, Any]]:
+        """Get stats dicts for every player on a team with at least one PA."""
+        return list(self.iter_team_player_stats(team_id))
+
+    def get_player_totals_by_name(self) -> List[Dict[str, Any]]:
+        """
+        Get counting stats summed across every team, one row per player name.
+
+        Players without plate appearances are left out. Rows are ordered by
+        name, ignoring case, and keyed like PlayerStats fields.
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             cursor.execute(
-                "SELECT outcome, bases, rbis, runs_scored FROM plate_appearances WHERE player_id = ?",
-                (player_id,),
+                f"""
+                SELECT p.name AS name,
+                       COUNT(*) AS plate_appearances,
+                       SUM(pa.kind = 'hit') AS hits,
+                       SUM(pa.kind = 'hit' AND pa.bases = 1) AS singles,
+                       SUM(pa.kind = 'hit' AND pa.bases = 2) AS doubles,
+                       SUM(pa.kind = 'hit' AND pa.bases = 3) AS triples,
+                       SUM(pa.kind = 'hit' AND pa.bases = 4) AS home_runs,
+                       SUM(pa.kind = 'walk') AS walks,
+                       SUM(pa.kind = 'sacrifice_fly') AS sacrifice_flies,
+                       SUM(pa.kind = 'home_run_out') AS home_run_outs,
+                       SUM(pa.rbis) AS rbis,
+                       SUM(pa.runs_scored) AS runs_scored
+                FROM players p
+                JOIN ({_CLASSIFIED_PLATE_APPEARANCES}) pa ON pa.player_id = p.id
+                GROUP BY p.name
+                ORDER BY LOWER(p.name), p.name
+                """
+            )
+            rows = []
+            for row in cursor:
+                totals = dict(row)
+                # At-bats = total attempts - walks - sacrifice_flies
+                totals["at_bats"] = (
+                    row["plate_appearances"] - row["walks"] - row["sacrifice_flies"]
+                )
+                rows.append(totals)
+            return rows
+
+    def iter_team_player_stats(self, team_id: int) -> Iterator[Dict[str, Any]]:
+        """Yield team player stats dicts one at a time, in player name order.
+
+        Classifies and sums plate appearances in one aggregate query, using
+        the same rules as get_player_stats. Rows are decoded as the cursor
+        yields them rather than fetched into a list first.
+        """
+        with self._get_connection() as conn:
+            cursor = conn.execute(
+                f"""
+                SELECT p.id, p.name, COUNT(*),
+                       SUM(pa.kind = 'hit'),
+                       SUM(pa.kind = 'hit' AND pa.bases = 1),
+                       SUM(pa.kind = 'hit' AND pa.bases = 2),
+                       SUM(pa.kind = 'hit' AND pa.bases = 3),
+                       SUM(pa.kind = 'hit' AND pa.bases = 4),
+                       SUM(pa.kind = 'walk'),
+                       SUM(pa.kind = 'strikeout'),
+                       SUM(pa.kind = 'home_run_out'),
+                       SUM(pa.kind = 'sacrifice_fly'),
+                       SUM(pa.rbis), SUM(pa.runs_scored)
+                FROM players p
+                JOIN ({_CLASSIFIED_PLATE_APPEARANCES}) pa ON pa.player_id = p.id
+                WHERE p.team_id = ?
+                GROUP BY p.id, p.name
+                ORDER BY p.name
+                """,
+                (team_id,),
             )
 
+            for (
+                player_id,
+                player_name,
+                total_attempts,
+                hits,
+                singles,
+                doubles,
+                triples,
+                home_runs,
+                walks,
+                strikeouts,
+                home_run_outs,
+                sacrifice_flies,
+                rbis,
+                runs_scored,
+            ) in cursor:
+                # At-bats = total attempts - walks - sacrifice_flies
+                at_bats = total_attempts - walks - sacrifice_flies
+                stats_dict = calculate_batting_stats(
+                    at_bats=at_bats,
+                    hits=hits,
+                    singles=singles,
+                    doubles=doubles,
+                    triples=triples,
+                    home_runs=home_runs,
+                    walks=walks,
+                    strikeouts=strikeouts,
+                    rbis=rbis,
+                    runs_scored=runs_scored,
+                    plate_appearances=total_attempts,
+                    sf=sacrifice_flies,
+                )
+                yield {
+                    "player_id": player_id,
+                    "player_name": player_name,
+                    "at_bats": at_bats,
+                    "hits": hits,
+                    "singles": singles,
+                    "doubles": doubles,
+                    "triples": triples,
+                    "home_runs": home_runs,
+                    "rbis": rbis,
+                    "runs_scored": runs_scored,
+                    "batting_average": stats_dict["batting_average"],
+                    "on_base_percentage": stats_dict["on_base_percentage"],
+                    "slugging_percentage": stats_dict["slugging_percentage"],
+                    "ops": stats_dict["ops"],
+                    "plate_appearances": total_attempts,
+                    "walks": walks,
+                    "sacrifice_flies": sacrifice_flies,
+                    "home_run_outs": home_run_outs,
+                }
+
+    def get_player_stats(
+        self, player_id: int, week_id: Optional[int] = None
+    ) -> Optional[PlayerStats]:
+        """Get calculated stats for a player, optionally for a specific week."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+
+            # Build query based on whether week_id is specified
+            if week_id is not None:
+                # Get attempts for this player in games from the specified week
+                cursor.execute(
+                    """
+                    SELECT ab.outcome, ab.bases, ab.rbis, ab.runs_scored
+                    FROM plate_appearances ab
+                    JOIN games g ON ab.game_id = g.id
+                    WHERE ab.player_id = ? AND g.week_id = ?
+                """,
+                    (player_id, week_id),
+                )
+            else:
+                # Get all attempts for this player
+                cursor.execute(
+                    """
+                    SELECT outcome, bases, rbis, runs_scored
+                    FROM plate_appearances
+                    WHERE player_id = ?
+                """,
+                    (player_id,),
+                )
+
             attempts = cursor.fetchall()
             if not attempts:
                 return None
@@ -305,7 +531,7 @@ class SQLiteQueryRepository(QueryRepository):
             strikeouts = 0
             rbis = 0
             runs_scored = 0
-            sacrifices = 0
+            sacrifice_flies = 0
             home_run_outs = 0
 
             for outcome, bases, attempt_rbis, attempt_runs in attempts:
@@ -329,12 +555,12 @@ class SQLiteQueryRepository(QueryRepository):
                         triples += 1
                     elif bases == 4:
                         home_runs += 1
-                elif attempt_rbis > 0:
-                    # Sacrifice: out with RBIs
-                    sacrifices += 1
+                elif attempt_rbis > 0 and outcome.startswith("F"):
+                    # Sacrifice Fly: fly ball out with RBIs
+                    sacrifice_flies += 1
 
-            # At-bats = total attempts - walks - sacrifices
-            at_bats = total_attempts - walks - sacrifices
+            # At-bats = total attempts - walks - sacrifice_flies
+            at_bats = total_attempts - walks - sacrifice_flies
 
             # Calculate advanced stats
             stats_dict = calculate_batting_stats(
@@ -349,6 +575,7 @@ class SQLiteQueryRepository(QueryRepository):
                 rbis=rbis,
                 runs_scored=runs_scored,
                 plate_appearances=total_attempts,
+                sf=sacrifice_flies,
             )
 
             return PlayerStats(
@@ -365,19 +592,80 @@ class SQLiteQueryRepository(QueryRepository):
                 on_base_percentage=stats_dict["on_base_percentage"],
                 slugging_percentage=stats_dict["slugging_percentage"],
                 ops=stats_dict["ops"],
-                plate_appearances=plate_appearances,
+                plate_appearances=int(stats_dict["plate_appearances"]),
                 walks=walks,
                 sacrifice_flies=sacrifice_flies,
                 home_run_outs=home_run_outs,
             )
 
 
+class _SessionConnection:
+    """Session connection handed out by _get_connection.
+
+    Its ``with`` block runs in a savepoint: an error rolls back only that
+    block's writes, as a plain connection would, while committing is left
+    to the enclosing session once at the end.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self._conn.execute("SAVEPOINT repository_call")
+        return self._conn
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is not None:
+            self._conn.execute("ROLLBACK TO repository_call")
+        self._conn.execute("RELEASE repository_call")
+        return False
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+
 class SQLiteRepository(SQLiteCommandRepository, SQLiteQueryRepository):
     """Combined SQLite repository for backwards compatibility."""
 
     def __init__(self, db_path: str):
         SQLiteCommandRepository.__init__(self, db_path)
         SQLiteQueryRepository.__init__(self, db_path)
+        self._session_conn: Optional[sqlite3.Connection] = None
+
+    def _get_connection(self):
+        """Get database connection, reusing the open session if any."""
+        if self._session_conn is not None:
+            return _SessionConnection(self._session_conn)
+        return sqlite3.connect(self.db_path)
+
+    @contextmanager
+    def session(self) -> Iterator[None]:
+        """
+        Run all repository calls in the block on one connection and transaction.
+
+        Commits once on success and rolls back everything on error, instead
+        of committing after every save. A session opened inside another one
+        joins it, leaving the commit to the outermost session.
+        """
+        if self._session_conn is not None:
+            yield
+            return
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+        conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB memory-mapped reads
+        # Open the transaction up front so releasing a savepoint never commits
+        conn.execute("BEGIN")
+        self._session_conn = conn
+        try:
+            with conn:
+                yield
+        finally:
+            self._session_conn = None
+            conn.close()
 
     def save_league(self, league: League) -> int:
         """Save a league and return its ID."""
@@ -388,7 +676,8 @@ class SQLiteRepository(SQLiteCommandRepository, SQLiteQueryRepository):
                     "INSERT OR IGNORE INTO leagues (name, season) VALUES (?, ?)",
                     (league.name, league.season),
                 )
-                league_id = cursor.lastrowid
+                # lastrowid is stale when the row was ignored on a reused connection
+                league_id = cursor.lastrowid if cursor.rowcount else None
                 if (
                     league_id == 0 or league_id is None
                 ):  # Already exists, get the existing ID
@@ -437,7 +726,7 @@ class SQLiteRepository(SQLiteCommandRepository, SQLiteQueryRepository):
                     "INSERT OR IGNORE INTO teams (league_id, name) VALUES (?, ?)",
                     (team.league_id, team.name),
                 )
-                team_id = cursor.lastrowid
+                team_id = cursor.lastrowid if cursor.rowcount else None
                 if (
                     team_id == 0 or team_id is None
                 ):  # Already exists, get the existing ID
@@ -489,7 +778,7 @@ class SQLiteRepository(SQLiteCommandRepository, SQLiteQueryRepository):
                     "INSERT OR IGNORE INTO players (team_id, name) VALUES (?, ?)",
                     (player.team_id, player.name),
                 )
-                player_id = cursor.lastrowid
+                player_id = cursor.lastrowid if cursor.rowcount else None
                 if (
                     player_id == 0 or player_id is None
                 ):  # Already exists, get the existing ID
@@ -533,7 +822,7 @@ class SQLiteRepository(SQLiteCommandRepository, SQLiteQueryRepository):
                         week.end_date.isoformat(),
                     ),
                 )
-                week_id = cursor.lastrowid
+                week_id = cursor.lastrowid if cursor.rowcount else None
                 if (
                     week_id == 0 or week_id is None
                 ):  # Already exists, get the existing ID
@@ -675,6 +964,28 @@ class SQLiteRepository(SQLiteCommandRepository, SQLiteQueryRepository):
             # Note: We don't delete leagues, teams, weeks, or players as they might be used by other games
             # In a more sophisticated system, you might implement cascading deletes or cleanup logic
 
+    def clear_all_data(self) -> None:
+        """
+        Delete every row from every table and compact the database file.
+
+        Inside a session the wipe joins the session's transaction, so it
+        rolls back with it on error; the file is then not compacted, since
+        VACUUM cannot run inside a transaction.
+        """
+        # Unfiltered DELETEs take SQLite's truncate path; in reverse
+        # dependency order
+        deletes = [f"DELETE FROM {table}" for table in _TABLES_IN_DELETE_ORDER]
+        in_session = getattr(self, "_session_conn", None) is not None
+        with self._get_connection() as conn:
+            if in_session:
+                for delete in deletes:
+                    conn.execute(delete)
+            else:
+                # One commit for all, then compact
+                conn.executescript(
+                    "BEGIN;\n" + ";\n".join(deletes) + ";\nCOMMIT;\nVACUUM;"
+                )
+
     def save_plate_appearance(self, attempt: PlateAppearance) -> int:
         """Save an at-bat attempt and return its ID."""
         with self._get_connection() as conn:
@@ -707,118 +1018,6 @@ class SQLiteRepository(SQLiteCommandRepository, SQLiteQueryRepository):
                 )
                 return attempt.id
 
-    def get_player_stats(
-        self, player_id: int, week_id: Optional[int] = None
-    ) -> Optional[PlayerStats]:
-        """Get calculated stats for a player, optionally for a specific week."""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-
-            # Build query based on whether week_id is specified
-            if week_id is not None:
-                # Get attempts for this player in games from the specified week
-                cursor.execute(
-                    """
-                    SELECT ab.outcome, ab.bases, ab.rbis, ab.runs_scored
-                    FROM plate_appearances ab
-                    JOIN games g ON ab.game_id = g.id
-                    WHERE ab.player_id = ? AND g.week_id = ?
-                """,
-                    (player_id, week_id),
-                )
-            else:
-                # Get all attempts for this player
-                cursor.execute(
-                    """
-                    SELECT outcome, bases, rbis, runs_scored
-                    FROM plate_appearances
-                    WHERE player_id = ?
-                """,
-                    (player_id,),
-                )
-
-            attempts = cursor.fetchall()
-            if not attempts:
-                return None
-
-            # Aggregate stats
-            total_attempts = len(attempts)
-            hits = 0
-            singles = 0
-            doubles = 0
-            triples = 0
-            home_runs = 0
-            walks = 0
-            strikeouts = 0
-            rbis = 0
-            runs_scored = 0
-            sacrifice_flies = 0
-            home_run_outs = 0
-
-            for outcome, bases, attempt_rbis, attempt_runs in attempts:
-                outcome_lower = outcome.lower()
-                rbis += attempt_rbis
-                runs_scored += attempt_runs
-
-                if outcome_lower.startswith("bb"):
-                    walks += 1
-                elif outcome_lower == "k":
-                    strikeouts += 1
-                elif outcome_lower == "hro":
-                    home_run_outs += 1
-                elif bases > 0:
-                    hits += 1
-                    if bases == 1:
-                        singles += 1
-                    elif bases == 2:
-                        doubles += 1
-                    elif bases == 3:
-                        triples += 1
-                    elif bases == 4:
-                        home_runs += 1
-                elif attempt_rbis > 0 and outcome.startswith("F"):
-                    # Sacrifice Fly: fly ball out with RBIs
-                    sacrifice_flies += 1
-
-            # At-bats = total attempts - walks - sacrifice_flies
-            at_bats = total_attempts - walks - sacrifice_flies
-
-            # Calculate advanced stats
-            stats_dict = calculate_batting_stats(
-                at_bats=at_bats,
-                hits=hits,
-                singles=singles,
-                doubles=doubles,
-                triples=triples,
-                home_runs=home_runs,
-                walks=walks,
-                strikeouts=strikeouts,
-                rbis=rbis,
-                runs_scored=runs_scored,
-                plate_appearances=total_attempts,
-                sf=sacrifice_flies,
-            )
-
-            return PlayerStats(
-                player_id=player_id,
-                at_bats=at_bats,
-                hits=hits,
-                singles=singles,
-                doubles=doubles,
-                triples=triples,
-                home_runs=home_runs,
-                rbis=rbis,
-                runs_scored=runs_scored,
-                batting_average=stats_dict["batting_average"],
-                on_base_percentage=stats_dict["on_base_percentage"],
-                slugging_percentage=stats_dict["slugging_percentage"],
-                ops=stats_dict["ops"],
-                plate_appearances=int(stats_dict["plate_appearances"]),
-                walks=walks,
-                sacrifice_flies=sacrifice_flies,
-                home_run_outs=home_run_outs,
-            )
-
     def save_game_data(self, objects: Dict[str, Any]) -> None:
         """Save all game data objects in the correct order."""
         # Save in dependency order: league -> team -> week -> game -> players -> plate_appearances
@@ -869,6 +1068,150 @@ class SQLiteRepository(SQLiteCommandRepository, SQLiteQueryRepository):
             )
             self.save_plate_appearance(attempt)
 
+    def save_parsed_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """
+        Save several games at once in a single transaction.
+
+        Each item holds the objects from create_database_objects plus a
+        "warnings" list. Rows are written table by table with executemany
+        and IDs are resolved by natural key, so the whole batch is saved or
+        none of it is.
+        """
+        if not batch:
+            return
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+
+            cursor.executemany(
+                "INSERT OR IGNORE INTO leagues (name, season) VALUES (?, ?)",
+                [(item["league"].name, item["league"].season) for item in batch],
+            )
+            league_ids = {
+                (name, season): league_id
+                for league_id, name, season in cursor.execute(
+                    "SELECT id, name, season FROM leagues"
+                )
+            }
+            league_id_list = [
+                league_ids[item["league"].name, item["league"].season] for item in batch
+            ]
+
+            cursor.executemany(
+                "INSERT OR IGNORE INTO teams (league_id, name) VALUES (?, ?)",
+                [
+                    (league_id, item["team"].name)
+                    for league_id, item in zip(league_id_list, batch)
+                ],
+            )
+            team_ids = {
+                (league_id, name): team_id
+                for team_id, league_id, name in cursor.execute(
+                    "SELECT id, league_id, name FROM teams"
+                )
+            }
+            team_id_list = [
+                team_ids[league_id, item["team"].name]
+                for league_id, item in zip(league_id_list, batch)
+            ]
+
+            cursor.executemany(
+                "INSERT OR IGNORE INTO weeks (league_id, week_number, start_date, end_date) VALUES (?, ?, ?, ?)",
+                [
+                    (
+                        league_id,
+                        item["week"].week_number,
+                        item["week"].start_date.isoformat(),
+                        item["week"].end_date.isoformat(),
+                    )
+                    for league_id, item in zip(league_id_list, batch)
+                ],
+            )
+            week_ids = {
+                (league_id, week_number): week_id
+                for week_id, league_id, week_number in cursor.execute(
+                    "SELECT id, league_id, week_number FROM weeks"
+                )
+            }
+            week_id_list = [
+                week_ids[league_id, item["week"].week_number]
+                for league_id, item in zip(league_id_list, batch)
+            ]
+
+            cursor.executemany(
+                "INSERT INTO games (week_id, team_id, date, opponent_team_id, game_number) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        week_id,
+                        team_id,
+                        item["game"].date.isoformat(),
+                        item["game"].opponent_team_id,
+                        item["game"].game_number,
+                    )
+                    for week_id, team_id, item in zip(week_id_list, team_id_list, batch)
+                ],
+            )
+            game_ids = {
+                (week_id, team_id, game_number): game_id
+                for game_id, week_id, team_id, game_number in cursor.execute(
+                    "SELECT id, week_id, team_id, game_number FROM games"
+                )
+            }
+
+            cursor.executemany(
+                "INSERT OR IGNORE INTO players (team_id, name) VALUES (?, ?)",
+                [
+                    (team_id, player.name)
+                    for team_id, item in zip(team_id_list, batch)
+                    for player in item["players"]
+                ],
+            )
+            player_ids = {
+                (team_id, name): player_id
+                for player_id, team_id, name in cursor.execute(
+                    "SELECT id, team_id, name FROM players"
+                )
+            }
+
+            plate_appearance_rows = []
+            for week_id, team_id, item in zip(week_id_list, team_id_list, batch):
+                game_id = game_ids[week_id, team_id, item["game"].game_number]
+                plate_appearance_rows.extend(
+                    (
+                        player_ids[team_id, attempt["player_name"]],
+                        game_id,
+                        attempt["outcome"],
+                        attempt["bases"],
+                        attempt["rbis"],
+                        attempt["runs_scored"],
+                    )
+                    for attempt in item["plate_appearances"]
+                )
+            cursor.executemany(
+                "INSERT INTO plate_appearances (player_id, game_id, outcome, bases, rbis, runs_scored) VALUES (?, ?, ?, ?, ?, ?)",
+                plate_appearance_rows,
+            )
+
+            cursor.executemany(
+                """
+                INSERT INTO parsing_warnings
+                (player_name, row_num, col_num, filename, original_attempt, assumption)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        warning["player_name"],
+                        warning["row_num"],
+                        warning["col_num"],
+                        warning["filename"],
+                        warning["original_attempt"],
+                        warning["assumption"],
+                    )
+                    for item in batch
+                    for warning in item.get("warnings", [])
+                ],
+            )
+
     def save_parsing_warnings(self, warnings: List[Dict[str, Any]]) -> None:
         """Save parsing warnings to the database."""
         if not warnings:
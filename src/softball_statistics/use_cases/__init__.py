@@ -4,7 +4,10 @@ Use cases for softball statistics application.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from contextlib import contextmanager
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from softball_statistics.calculators.stats_calculator import (
     calculate_batting_average,
@@ -19,6 +22,27 @@ class ValidationError(Exception):
     """Raised when game data validation fails."""
 
 
+def parse_game_file(parser: Parser, file_path: str) -> Dict[str, Any]:
+    """Parse a game file and validate that its RBI total equals its run total.
+
+    Module-level (rather than a method) so it can be sent to worker processes.
+    """
+    # Parse the file
+    parsed_data = parser.parse(file_path)
+
+    # Validate RBI total equals run total
+    total_rbis = sum(pa["rbis"] for pa in parsed_data["plate_appearances"])
+    total_runs = sum(pa["runs_scored"] for pa in parsed_data["plate_appearances"])
+
+    if total_rbis != total_runs:
+        raise ValidationError(
+            f"RBI total ({total_rbis}) does not equal run total ({total_runs}). "
+            f"File rejected."
+        )
+
+    return parsed_data
+
+
 class ProcessGameUseCase:
     """Use case for processing a game file."""
 
@@ -37,19 +61,23 @@ class ProcessGameUseCase:
 
         Returns parsed data with metadata.
         """
-        # Parse the file
-        parsed_data = self.parser.parse(file_path)
+        parsed_data = self.parse(file_path)
+        return self.persist(parsed_data, replace_existing=replace_existing)
 
-        # Validate RBI total equals run total
-        total_rbis = sum(pa["rbis"] for pa in parsed_data["plate_appearances"])
-        total_runs = sum(pa["runs_scored"] for pa in parsed_data["plate_appearances"])
+    def parse(self, file_path: str) -> Dict[str, Any]:
+        """Parse and validate a game file without touching the repository.
 
-        if total_rbis != total_runs:
-            raise ValidationError(
-                f"RBI total ({total_rbis}) does not equal run total ({total_runs}). "
-                f"File rejected."
-            )
+        Safe to run concurrently for different files.
+        """
+        return parse_game_file(self.parser, file_path)
 
+    def persist(
+        self, parsed_data: Dict[str, Any], replace_existing: bool = False
+    ) -> Dict[str, Any]:
+        """Save data returned by parse() to the repository.
+
+        Returns the parsed data unchanged.
+        """
         # Create database objects
         # Note: This assumes create_database_objects is moved to domain or injected
         # For now, keep as is, but ideally refactor
@@ -84,12 +112,85 @@ class ProcessGameUseCase:
 
         return parsed_data
 
+    def persist_batch(self, parsed_list: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """Save many parse() results with a single repository call.
+
+        Games that already exist, in the repository or earlier in the batch,
+        are skipped. A game that cannot be built or saved fails only its own
+        entry. Returns one error message (or None) per input.
+        """
+        from softball_statistics.parsers.csv_parser import create_database_objects
+
+        errors: List[Optional[str]] = []
+        batch = []
+        seen = set()
+        for index, parsed_data in enumerate(parsed_list):
+            try:
+                metadata = parsed_data["metadata"]
+                game_key = (
+                    metadata["league"],
+                    metadata["team"],
+                    metadata["season"],
+                    int(metadata["game"]),
+                )
+                if game_key in seen or self.query_repo.game_exists(
+                    metadata["league"],
+                    metadata["team"],
+                    metadata["season"],
+                    metadata["game"],
+                ):
+                    errors.append("Game already exists")
+                    continue
+                objects = create_database_objects(parsed_data)
+            except Exception as e:
+                errors.append(str(e))
+                continue
+
+            seen.add(game_key)
+            objects["warnings"] = parsed_data.get("warnings", [])
+            batch.append((index, objects))
+            errors.append(None)
+
+        try:
+            self.command_repo.save_parsed_batch([objects for _, objects in batch])
+        except Exception:
+            # The batch rolled back; save game by game so only the failing
+            # games are reported (each call is its own savepoint in a session)
+            for index, objects in batch:
+                try:
+                    self.command_repo.save_parsed_batch([objects])
+                except Exception as e:
+                    errors[index] = str(e)
+        return errors
+
+
+# Game metadata keys, named as in get_team_games_stats results
+_GAME_KEYS = ("game_id", "game_number", "date", "week_number", "league_name", "season")
+
 
 class CalculateStatsUseCase:
     """Use case for calculating and retrieving statistics."""
 
     def __init__(self, query_repo: QueryRepository):
         self.query_repo = query_repo
+        self._cumulative_cache: Optional[Dict[Tuple[int, ...], Dict[str, Any]]] = None
+
+    @contextmanager
+    def caching(self) -> Iterator[None]:
+        """
+        Reuse cumulative team stats computed earlier in the block.
+
+        For callers such as an export that ask for the same teams more than
+        once while the data cannot change; the cache is dropped on exit.
+        """
+        if self._cumulative_cache is not None:
+            yield
+            return
+        self._cumulative_cache = {}
+        try:
+            yield
+        finally:
+            self._cumulative_cache = None
 
     def execute(self, league_name: str, team_name: str, season: str) -> Dict[str, Any]:
         """Calculate stats for a team.
@@ -97,57 +198,21 @@ class CalculateStatsUseCase:
         Returns stats data ready for export.
         """
         # Find league
-        leagues = self.query_repo.list_leagues()
-        league = next(
-            (l for l in leagues if l.name == league_name and l.season == season), None
-        )
+        league = self.query_repo.find_league(league_name, season)
         if not league or not league.id:
             raise ValueError(f"League '{league_name}' season '{season}' not found")
 
         # Find team
-        teams = self.query_repo.list_teams_by_league(league.id)
-        team = next((t for t in teams if t.name == team_name), None)
+        team = self.query_repo.find_team(league.id, team_name)
         if not team or not team.id:
             raise ValueError(f"Team '{team_name}' not found in league")
 
         # Get players and stats
-        # Note: This uses raw SQL access, should be abstracted
         players_data = []
-        # For now, keep similar logic, but ideally repository should provide this
         from softball_statistics.repository.sqlite import SQLiteQueryRepository
 
         if isinstance(self.query_repo, SQLiteQueryRepository):
-            with self.query_repo._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT id, name FROM players WHERE team_id = ?", (team.id,)
-                )
-                players = cursor.fetchall()
-
-            for player_id, player_name in players:
-                stats = self.query_repo.get_player_stats(player_id)
-                if stats:
-                    player_stats_dict = {
-                        "player_id": player_id,
-                        "player_name": player_name,
-                        "at_bats": stats.at_bats,
-                        "hits": stats.hits,
-                        "singles": stats.singles,
-                        "doubles": stats.doubles,
-                        "triples": stats.triples,
-                        "home_runs": stats.home_runs,
-                        "rbis": stats.rbis,
-                        "runs_scored": stats.runs_scored,
-                        "batting_average": stats.batting_average,
-                        "on_base_percentage": stats.on_base_percentage,
-                        "slugging_percentage": stats.slugging_percentage,
-                        "ops": stats.ops,
-                        "plate_appearances": stats.plate_appearances,
-                        "walks": stats.walks,
-                        "sacrifice_flies": stats.sacrifice_flies,
-                        "home_run_outs": stats.home_run_outs,
-                    }
-                    players_data.append(player_stats_dict)
+            players_data = self.query_repo.get_team_player_stats(team.id)
 
         # Calculate team-level statistics
         team_totals = self._calculate_team_totals(players_data)
@@ -256,10 +321,40 @@ class CalculateStatsUseCase:
 
         return self._get_cumulative_team_stats_for_team_ids(all_team_ids)
 
+    def get_cumulative_stats_all_teams(self) -> Dict[str, Dict[str, Any]]:
+        """Get cumulative stats for every team name, keyed by team name.
+
+        Equivalent to calling get_cumulative_team_stats for each team, but
+        resolves every team's season IDs with a single query.
+        """
+        from softball_statistics.repository.sqlite import SQLiteQueryRepository
+
+        if not isinstance(self.query_repo, SQLiteQueryRepository):
+            raise ValueError("Cumulative stats require SQLite repository")
+
+        team_ids_by_name: Dict[str, list[int]] = {}
+        for team in self.query_repo.list_all_teams():
+            team_ids_by_name.setdefault(team.name, []).append(team.id)
+
+        return {
+            team_name: self._get_cumulative_team_stats_for_team_ids(sorted(team_ids))
+            for team_name, team_ids in team_ids_by_name.items()
+        }
+
     def _get_cumulative_team_stats_for_team_ids(
         self, team_ids: list[int]
     ) -> Dict[str, Any]:
         """Get cumulative stats across explicit season-specific team IDs."""
+        cache = self._cumulative_cache
+        if cache is not None:
+            key = tuple(team_ids)
+            if key not in cache:
+                cache[key] = self._compute_cumulative_team_stats(team_ids)
+            return cache[key]
+        return self._compute_cumulative_team_stats(team_ids)
+
+    def _compute_cumulative_team_stats(self, team_ids: list[int]) -> Dict[str, Any]:
+        """Aggregate players and team totals across season-specific team IDs."""
         all_team_ids = team_ids
 
         # Get all players for these teams and aggregate by player_name
@@ -379,21 +474,30 @@ class CalculateStatsUseCase:
                 JOIN weeks w ON g.week_id = w.id
                 JOIN leagues l ON w.league_id = l.id
                 WHERE g.team_id = ?
-                ORDER BY g.date
+                ORDER BY g.date, g.id
                 """,
                 (team_id,),
             )
             games = cursor.fetchall()
 
+            # Get the plate appearances for all of the team's games at once,
+            # rather than re-running the same query for every game
+            cursor.execute(
+                """
+                SELECT pa.game_id, pa.outcome, pa.bases, pa.rbis, pa.runs_scored
+                FROM plate_appearances pa
+                JOIN games g ON pa.game_id = g.id
+                WHERE g.team_id = ?
+                ORDER BY pa.id
+                """,
+                (team_id,),
+            )
+            attempts_by_game: Dict[int, list] = {}
+            for pa_game_id, *attempt in cursor.fetchall():
+                attempts_by_game.setdefault(pa_game_id, []).append(attempt)
+
         for game_id, game_number, date, week_number, league_name, season in games:
-            # Get all plate appearances for this game
-            with self.query_repo._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT outcome, bases, rbis, runs_scored FROM plate_appearances WHERE game_id = ?",
-                    (game_id,),
-                )
-                attempts = cursor.fetchall()
+            attempts = attempts_by_game.get(game_id, [])
 
             # Aggregate game stats
             total_attempts = len(attempts)
@@ -452,22 +556,24 @@ class CalculateStatsUseCase:
                 "home_run_outs": home_run_outs,
                 "rbis": rbis,
                 "runs_scored": runs_scored,
-                "batting_average": calculate_batting_average(hits, at_bats)
-                if at_bats > 0
-                else 0.0,
-                "on_base_percentage": calculate_batting_average(hits, at_bats)
-                if at_bats > 0
-                else 0.0,  # Simplified
-                "slugging_percentage": calculate_slg(
-                    singles, doubles, triples, home_runs, at_bats
-                )
-                if at_bats > 0
-                else 0.0,
-                "ops": calculate_ops(
-                    calculate_batting_average(hits, at_bats) if at_bats > 0 else 0.0,
+                "batting_average": (
+                    calculate_batting_average(hits, at_bats) if at_bats > 0 else 0.0
+                ),
+                "on_base_percentage": (
+                    calculate_batting_average(hits, at_bats) if at_bats > 0 else 0.0
+                ),  # Simplified
+                "slugging_percentage": (
                     calculate_slg(singles, doubles, triples, home_runs, at_bats)
                     if at_bats > 0
-                    else 0.0,
+                    else 0.0
+                ),
+                "ops": calculate_ops(
+                    calculate_batting_average(hits, at_bats) if at_bats > 0 else 0.0,
+                    (
+                        calculate_slg(singles, doubles, triples, home_runs, at_bats)
+                        if at_bats > 0
+                        else 0.0
+                    ),
                 ),
             }
             games_stats.append(game_stats)
@@ -481,8 +587,6 @@ class CalculateStatsUseCase:
         if not isinstance(self.query_repo, SQLiteQueryRepository):
             return []
 
-        player_stats = {}
-
         with self.query_repo._get_connection() as conn:
             cursor = conn.cursor()
             # Get all plate appearances for this game with player info
@@ -498,6 +602,64 @@ class CalculateStatsUseCase:
             )
             attempts = cursor.fetchall()
 
+        return self._aggregate_game_player_stats(attempts)
+
+    def get_team_game_player_stats(
+        self, team_id: int
+    ) -> Dict[int, list[Dict[str, Any]]]:
+        """Get individual player stats for every game of a team, keyed by game ID.
+
+        Same rows as get_game_player_stats for each game, fetched in one query
+        rather than one per game.
+        """
+        return {
+            game["game_id"]: player_stats
+            for game, player_stats in self.iter_team_game_player_stats(team_id)
+        }
+
+    def iter_team_game_player_stats(
+        self, team_id: int
+    ) -> Iterator[Tuple[Dict[str, Any], list[Dict[str, Any]]]]:
+        """Yield (game, player stats) for a team's games, one game at a time.
+
+        Each game dict carries the game_id, game_number, date, week_number,
+        league_name and season keys of get_team_games_stats, so per-game
+        output needs no second pass over the same plate appearances. Games
+        come in the same order; games without plate appearances are skipped.
+        Only the current game's rows are held in memory.
+        """
+        from softball_statistics.repository.sqlite import SQLiteQueryRepository
+
+        if not isinstance(self.query_repo, SQLiteQueryRepository):
+            return
+
+        with self.query_repo._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT g.id, g.game_number, g.date, w.week_number,
+                       l.name, l.season,
+                       pa.outcome, pa.bases, pa.rbis, pa.runs_scored, p.id, p.name
+                FROM plate_appearances pa
+                JOIN games g ON pa.game_id = g.id
+                JOIN weeks w ON g.week_id = w.id
+                JOIN leagues l ON w.league_id = l.id
+                JOIN players p ON pa.player_id = p.id
+                WHERE g.team_id = ?
+                ORDER BY g.date, g.id, p.name
+                """,
+                (team_id,),
+            )
+            for game_row, rows in groupby(cursor, key=itemgetter(0, 1, 2, 3, 4, 5)):
+                yield dict(zip(_GAME_KEYS, game_row)), (
+                    self._aggregate_game_player_stats([row[6:] for row in rows])
+                )
+
+    @staticmethod
+    def _aggregate_game_player_stats(attempts: list) -> list[Dict[str, Any]]:
+        """Aggregate one game's (outcome, bases, rbis, runs, player ID, name) rows."""
+        player_stats: Dict[int, Dict[str, Any]] = {}
+
         # Group by player
         for outcome, bases, rbis, runs_scored, player_id, player_name in attempts:
             if player_id not in player_stats:
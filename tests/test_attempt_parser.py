@@ -5,6 +5,7 @@ from softball_statistics.parsers.attempt_parser import (
     _is_fly_ball,
     _is_ground_ball,
     _is_other_out,
+    _is_out_notation,
     _is_simple_fielding,
     parse_attempt,
 )
@@ -62,6 +63,19 @@ class TestIsOutNotation:
     def test_is_other_out_invalid(self, attempt):
         assert _is_other_out(attempt) is False
 
+    @pytest.mark.parametrize(
+        "attempt",
+        ["f4", "f10", "f6-4", "f10-4-3", "5-1", "01-10", "4", "0", "a1", "p10"]
+        + ["f11", "f6-", "f-4", "5-", "-5", "11-1", "a0", "a011", "ab", "4-f6", ""],
+    )
+    def test_is_out_notation_matches_individual_checks(self, attempt):
+        assert _is_out_notation(attempt) is (
+            _is_fly_ball(attempt)
+            or _is_ground_ball(attempt)
+            or _is_simple_fielding(attempt)
+            or _is_other_out(attempt)
+        )
+
     def test_triple_hit(self):
         """Test parsing a triple (3B)."""
         result = parse_attempt("3B")
@@ -438,3 +452,18 @@ class TestIsOutNotation:
             "runs_scored": 1,
             "warnings": [],
         }
+
+    def test_repeated_attempt_returns_fresh_result_with_own_context(self):
+        """Test that repeated notations never share results or warning context."""
+        first = parse_attempt("HR", "Alice", 2, 3, "game.csv")
+        first["rbis"] = 99
+        first["warnings"].clear()
+
+        second = parse_attempt("HR", "Bob", 4, 5, "game.csv")
+
+        assert second["rbis"] == 1
+        assert second["runs_scored"] == 1
+        (warning,) = second["warnings"]
+        assert warning["player_name"] == "Bob"
+        assert (warning["row_num"], warning["col_num"]) == (4, 5)
+        assert warning["original_attempt"] == "hr"
@@ -0,0 +1,64 @@
+import sqlite3
+
+from softball_statistics.cli import CLI
+from softball_statistics.parsers.csv_parser import CSVParser
+from softball_statistics.repository.sqlite import SQLiteRepository
+
+
+class LockCheckingParser(CSVParser):
+    """CSV parser that fails if another connection holds the write lock."""
+
+    def __init__(self, db_path: str):
+        super().__init__()
+        self.db_path = db_path
+
+    def parse(self, file_path: str):
+        conn = sqlite3.connect(self.db_path, timeout=0)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.rollback()
+        finally:
+            conn.close()
+        return super().parse(file_path)
+
+
+class TestReparseAll:
+    def test_reparse_all_parses_in_parallel_then_saves(
+        self, tmp_path, monkeypatch, capsys
+    ):
+        """Test that --reparse-all rebuilds the database from data/input."""
+        input_dir = tmp_path / "data" / "input"
+        input_dir.mkdir(parents=True)
+        for game in ("01", "00", "02"):
+            (input_dir / f"fray-cyclones-spring-{game}.csv").write_text(
+                "Player Name,Attempt1\nPlayer1,1B\n"
+            )
+        (input_dir / "notes.txt").write_text("not a game")
+        repo = SQLiteRepository(str(tmp_path / "stats.db"))
+        monkeypatch.chdir(tmp_path)
+
+        cli = CLI(repo, repo, LockCheckingParser(repo.db_path))
+        cli.run(["--reparse-all"])
+        output = capsys.readouterr().out
+
+        assert "Found 3 CSV files to process..." in output
+        assert (
+            "Error processing fray-cyclones-spring-00.csv: "
+            "Week number must be positive" in output
+        )
+        assert "Reparsing complete: 2 successful, 1 errors" in output
+        assert self._player_plate_appearances(repo) == {"Player1": 2}
+
+        # A second reparse wipes the first one instead of adding to it
+        cli.run(["--reparse-all"])
+
+        assert "2 successful, 1 errors" in capsys.readouterr().out
+        assert self._player_plate_appearances(repo) == {"Player1": 2}
+
+    @staticmethod
+    def _player_plate_appearances(repo):
+        """Map each player name to plate appearances across all teams."""
+        return {
+            row["name"]: row["plate_appearances"]
+            for row in repo.get_player_totals_by_name()
+        }
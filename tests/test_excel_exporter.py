@@ -5,10 +5,18 @@ from datetime import date
 import pytest
 from openpyxl import load_workbook
 
+from softball_statistics.calculators.stats_calculator import (
+    calculate_batting_average,
+    calculate_ops,
+    calculate_slg,
+)
 from softball_statistics.exporters.excel_exporter import (
     ExcelExportError,
     _abbreviate_team_name,
+    _build_summary_from_stats_data,
+    _column_totals,
     _get_seasons_for_team,
+    _summary_rate_stats,
     export_to_excel,
 )
 from softball_statistics.models import Game, League, Team, Week
@@ -63,6 +71,52 @@ class TestExcelExporter:
             "Summer 2027",
         ]
 
+    def test_column_totals_sums_each_column_as_ints(self):
+        """Totals should be plain ints per column, zero for no rows."""
+        rows = [{"Player": "A", "PA": 4, "H": 2}, {"Player": "B", "PA": 3, "H": 0}]
+
+        totals = _column_totals(rows, ("PA", "H"))
+
+        assert totals == {"PA": 7, "H": 2}
+        assert all(type(value) is int for value in totals.values())
+        assert _column_totals([], ("PA", "H")) == {"PA": 0, "H": 0}
+
+    def test_summary_rate_stats_match_scalar_calculators(self):
+        """Array rate stats should format exactly like the scalar functions."""
+        player_totals = [
+            {
+                "at_bats": at_bats,
+                "hits": hits,
+                "singles": hits - extra,
+                "doubles": extra,
+                "triples": 0,
+                "home_runs": 0,
+            }
+            for at_bats in (0, 3, 7, 80, 2000)
+            for hits in (0, 1, 3, 7)
+            for extra in (0, 1)
+            if extra <= hits <= at_bats
+        ]
+
+        rate_stats = _summary_rate_stats(player_totals)
+
+        assert len(rate_stats) == len(player_totals)
+        for totals, (ba, slg, ops) in zip(player_totals, rate_stats):
+            ab = totals["at_bats"]
+            expected_ba = calculate_batting_average(totals["hits"], ab)
+            expected_slg = calculate_slg(totals["singles"], totals["doubles"], 0, 0, ab)
+            assert ba == f"{expected_ba:.3f}"
+            assert slg == f"{expected_slg:.3f}"
+            assert ops == f"{calculate_ops(float(ba), float(slg)):.3f}"
+
+    def test_summary_fallback_title_cases_league_like_filename_parser(self):
+        """Fallback league names should match how parsed filenames are stored."""
+        summary = _build_summary_from_stats_data(
+            {"league_name": "o'brien_co-ed", "team_stats": {"Cyclones": {}}}, None
+        )
+
+        assert summary[0]["League"] == "O'Brien Co-Ed"
+
     def test_export_basic_stats(self):
         """Test exporting basic team statistics."""
         stats_data = {
@@ -127,6 +181,45 @@ class TestExcelExporter:
             if os.path.exists(output_path):
                 os.unlink(output_path)
 
+    def test_player_details_written_to_one_sheet(self, tmp_path):
+        """Player details for every team should share one filterable sheet."""
+        players = {
+            "Cyclones": ["Alice", "Bob"],
+            "Bolts": ["Carol"],
+        }
+        stats_data = {
+            "include_player_details": True,
+            "team_stats": {
+                team_name: {
+                    "players": [
+                        {
+                            "player_id": player_id,
+                            "player_name": name,
+                            "at_bats": 4,
+                            "hits": 1,
+                            "batting_average": 0.25,
+                        }
+                        for player_id, name in enumerate(names, start=1)
+                    ]
+                }
+                for team_name, names in players.items()
+            },
+        }
+        output_path = str(tmp_path / "details.xlsx")
+
+        export_to_excel(stats_data, output_path)
+
+        workbook = load_workbook(output_path)
+        assert [name for name in workbook.sheetnames if "detail" in name.lower()] == [
+            "Player Details"
+        ]
+        rows = list(workbook["Player Details"].values)
+        assert rows[0] == ("Team", "Player", "Statistic", "Value")
+        assert len(rows) == 1 + 3 * 7
+        assert ("Bolts", "Carol", "Batting Average", "0.250") in rows
+        assert ("Cyclones", "Bob", "OPS", "0.000") in rows
+        assert workbook["Player Details"].auto_filter.ref == "A1:D22"
+
     def test_export_empty_stats(self):
         """Test exporting with no team data."""
         stats_data = {
@@ -286,6 +379,14 @@ class TestExcelExporter:
             expected_ref = "A1:P2"  # Assuming 16 columns (A-P)
             assert sheet.auto_filter.ref == expected_ref
 
+            # Equal adjacent widths share one range: Player, counts, rates
+            widths = {
+                (dim.min, dim.max): dim.width
+                for dim in sheet.column_dimensions.values()
+                if dim.customWidth
+            }
+            assert widths == {(1, 1): 20, (2, 12): 8, (13, 16): 10}
+
         finally:
             if os.path.exists(output_path):
                 os.unlink(output_path)
@@ -1,3 +1,4 @@
+import sys
 from datetime import date
 
 import pytest
@@ -171,3 +172,10 @@ class TestPlayerStats:
     def test_stats_negative_values(self):
         with pytest.raises(ValueError, match="at_bats cannot be negative"):
             PlayerStats(player_id=1, at_bats=-1)
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slots need 3.10")
+    def test_stats_are_slotted_and_mutable(self):
+        stats = PlayerStats(player_id=1)
+        assert not hasattr(stats, "__dict__")
+        stats.hits = 2
+        assert stats.hits == 2
@@ -1,7 +1,13 @@
+import sqlite3
+from datetime import date
+
 import pytest
 
-from softball_statistics.models import League
-from softball_statistics.repository.sqlite import SQLiteRepository
+from softball_statistics.models import Game, League, Player, Team, Week
+from softball_statistics.repository.sqlite import (
+    SQLiteQueryRepository,
+    SQLiteRepository,
+)
 
 
 @pytest.fixture
@@ -283,3 +289,338 @@ class TestSQLiteRepository:
         assert stats.hits == 1
         assert stats.walks == 1
         assert stats.home_run_outs == 1  # HRO should be counted
+
+    def test_session_commits_once_at_end(self, repo):
+        """Test that writes inside a session share one transaction."""
+        with repo.session():
+            repo.save_league(League(id=None, name="Session League", season="Fall"))
+            # Not yet visible to an independent connection
+            other = sqlite3.connect(repo.db_path)
+            assert other.execute("SELECT COUNT(*) FROM leagues").fetchone()[0] == 0
+            other.close()
+
+        assert [l.name for l in repo.list_leagues()] == ["Session League"]
+
+    def test_session_resolves_existing_ids(self, repo):
+        """Test that re-saving an existing row inside a session returns its ID."""
+        with repo.session():
+            first_id = repo.save_league(League(id=None, name="A", season="Fall"))
+            repo.save_league(League(id=None, name="B", season="Fall"))
+            again_id = repo.save_league(League(id=None, name="A", season="Fall"))
+
+        assert again_id == first_id
+
+    def test_session_rolls_back_on_error(self, repo):
+        """Test that an error inside a session discards all its writes."""
+        with pytest.raises(RuntimeError):
+            with repo.session():
+                repo.save_league(League(id=None, name="Lost League", season="Fall"))
+                raise RuntimeError("boom")
+
+        assert repo.list_leagues() == []
+
+    def test_save_parsed_batch_matches_per_game_saves(self, repo, tmp_path):
+        """Test that a batch save stores the same rows as saving game by game."""
+
+        def make_objects(team_name, game_number):
+            return {
+                "league": League(id=None, name="Fray", season="Spring 2025"),
+                "team": Team(id=None, league_id=None, name=team_name),
+                "week": Week(
+                    None, None, game_number, date(2025, 4, 1), date(2025, 4, 1)
+                ),
+                "game": Game(date=date(2025, 4, game_number), game_number=game_number),
+                "players": [Player(id=None, team_id=None, name="Player One")],
+                "plate_appearances": [
+                    {
+                        "player_name": "Player One",
+                        "outcome": "1B",
+                        "bases": 1,
+                        "rbis": 0,
+                        "runs_scored": 0,
+                    }
+                ],
+                "warnings": [],
+            }
+
+        games = [("Cyclones", 1), ("Cyclones", 2), ("Bolts", 1)]
+        repo.save_parsed_batch([make_objects(team, game) for team, game in games])
+
+        other = SQLiteRepository(str(tmp_path / "other.db"))
+        for team, game in games:
+            other.save_game_data(make_objects(team, game))
+
+        query = """
+            SELECT l.name, t.name, w.week_number, g.game_number, g.date,
+                   p.name, pa.outcome
+            FROM plate_appearances pa
+            JOIN players p ON pa.player_id = p.id
+            JOIN games g ON pa.game_id = g.id
+            JOIN weeks w ON g.week_id = w.id
+            JOIN teams t ON g.team_id = t.id
+            JOIN leagues l ON t.league_id = l.id
+            ORDER BY pa.id
+        """
+        with repo._get_connection() as conn:
+            batch_rows = conn.execute(query).fetchall()
+        with other._get_connection() as conn:
+            single_rows = conn.execute(query).fetchall()
+        assert len(batch_rows) == 3
+        assert batch_rows == single_rows
+
+    def test_find_league_and_team(self, repo):
+        """Test looking up a league and team by natural key."""
+        league_id = repo.save_league(League(id=None, name="Fray", season="Spring"))
+        repo.save_league(League(id=None, name="Fray", season="Summer"))
+        team_id = repo.save_team(Team(id=None, league_id=league_id, name="Cyclones"))
+
+        league = repo.find_league("Fray", "Spring")
+        assert league is not None and league.id == league_id
+        assert repo.find_league("Fray", "Fall") is None
+
+        team = repo.find_team(league_id, "Cyclones")
+        assert team is not None and team.id == team_id
+        assert repo.find_team(league_id, "Bolts") is None
+
+    def test_get_team_player_stats_matches_per_player_stats(self, repo):
+        """Test that the team aggregate query agrees with per-player stats."""
+        outcomes = [
+            ("Alice", "1B", 1, 0, 0),
+            ("Alice", "HR", 4, 2, 1),
+            ("Alice", "BB", 0, 0, 0),
+            ("Alice", "F8", 0, 1, 0),
+            ("Bob", "K", 0, 0, 0),
+            ("Bob", "HRO", 0, 0, 0),
+            ("Bob", "2B", 2, 0, 1),
+            ("Bob", "3B", 3, 1, 0),
+            ("Cara", "6-3", 0, 0, 0),
+        ]
+        repo.save_game_data(
+            {
+                "league": League(id=None, name="Fray", season="Spring 2025"),
+                "team": Team(id=None, league_id=None, name="Cyclones"),
+                "week": Week(None, None, 1, date(2025, 4, 1), date(2025, 4, 1)),
+                "game": Game(date=date(2025, 4, 1), game_number=1),
+                "players": [
+                    Player(id=None, team_id=None, name=name)
+                    for name in ("Bob", "Alice", "Cara", "Benchwarmer")
+                ],
+                "plate_appearances": [
+                    {
+                        "player_name": name,
+                        "outcome": outcome,
+                        "bases": bases,
+                        "rbis": rbis,
+                        "runs_scored": runs,
+                    }
+                    for name, outcome, bases, rbis, runs in outcomes
+                ],
+                "warnings": [],
+            }
+        )
+        league = repo.find_league("Fray", "Spring 2025")
+        team = repo.find_team(league.id, "Cyclones")
+
+        players_data = repo.get_team_player_stats(team.id)
+
+        # Players without plate appearances are left out, names in order
+        assert [p["player_name"] for p in players_data] == ["Alice", "Bob", "Cara"]
+        for player in players_data:
+            stats = repo.get_player_stats(player["player_id"])
+            for key, value in player.items():
+                if key not in ("player_id", "player_name"):
+                    assert value == getattr(stats, key), key
+        assert list(repo.iter_team_player_stats(team.id)) == players_data
+        query_repo = SQLiteQueryRepository(repo.db_path)
+        assert query_repo.get_team_player_stats(team.id) == players_data
+        assert query_repo.get_player_stats(players_data[0]["player_id"]) == (
+            repo.get_player_stats(players_data[0]["player_id"])
+        )
+        assert players_data[0]["sacrifice_flies"] == 1
+        assert players_data[1]["home_run_outs"] == 1
+
+    def test_iter_team_player_stats_streams_one_query(self, repo):
+        """Test that team player stats are yielded from a single query."""
+        repo.save_game_data(
+            {
+                "league": League(id=None, name="Fray", season="Spring 2025"),
+                "team": Team(id=None, league_id=None, name="Cyclones"),
+                "week": Week(None, None, 1, date(2025, 4, 1), date(2025, 4, 1)),
+                "game": Game(date=date(2025, 4, 1), game_number=1),
+                "players": [
+                    Player(id=None, team_id=None, name=name)
+                    for name in ("Alice", "Bob")
+                ],
+                "plate_appearances": [
+                    {
+                        "player_name": name,
+                        "outcome": "1B",
+                        "bases": 1,
+                        "rbis": 0,
+                        "runs_scored": 0,
+                    }
+                    for name in ("Alice", "Bob")
+                ],
+                "warnings": [],
+            }
+        )
+        team = repo.find_team(repo.find_league("Fray", "Spring 2025").id, "Cyclones")
+        statements = []
+
+        class TracingQueryRepository(SQLiteQueryRepository):
+            def _get_connection(self):
+                conn = super()._get_connection()
+                conn.set_trace_callback(statements.append)
+                return conn
+
+        rows = TracingQueryRepository(repo.db_path).iter_team_player_stats(team.id)
+
+        assert next(rows)["player_name"] == "Alice"
+        assert [row["player_name"] for row in rows] == ["Bob"]
+        assert len(statements) == 1
+
+    def test_get_player_totals_by_name_sums_across_teams(self, repo):
+        """Test that player totals are combined by name across teams."""
+        for game_number, (team_name, outcome, bases, rbis) in enumerate(
+            [("Cyclones", "1B", 1, 0), ("Bolts", "HR", 4, 1), ("Bolts", "F8", 0, 1)],
+            start=1,
+        ):
+            repo.save_game_data(
+                {
+                    "league": League(id=None, name="Fray", season="Spring 2025"),
+                    "team": Team(id=None, league_id=None, name=team_name),
+                    "week": Week(
+                        None,
+                        None,
+                        game_number,
+                        date(2025, 4, game_number),
+                        date(2025, 4, game_number),
+                    ),
+                    "game": Game(
+                        date=date(2025, 4, game_number), game_number=game_number
+                    ),
+                    "players": [Player(id=None, team_id=None, name="Alice")],
+                    "plate_appearances": [
+                        {
+                            "player_name": "Alice",
+                            "outcome": outcome,
+                            "bases": bases,
+                            "rbis": rbis,
+                            "runs_scored": 0,
+                        }
+                    ],
+                    "warnings": [],
+                }
+            )
+
+        (alice,) = repo.get_player_totals_by_name()
+
+        assert alice["name"] == "Alice"
+        assert alice["plate_appearances"] == 3
+        assert alice["at_bats"] == 2
+        assert alice["hits"] == 2
+        assert alice["singles"] == 1
+        assert alice["home_runs"] == 1
+        assert alice["sacrifice_flies"] == 1
+        assert alice["rbis"] == 2
+
+    def test_get_player_totals_by_name_orders_ignoring_case(self, repo):
+        """Test that player totals are ordered by name regardless of case."""
+        repo.save_game_data(
+            {
+                "league": League(id=None, name="Fray", season="Spring 2025"),
+                "team": Team(id=None, league_id=None, name="Cyclones"),
+                "week": Week(None, None, 1, date(2025, 4, 1), date(2025, 4, 1)),
+                "game": Game(date=date(2025, 4, 1), game_number=1),
+                "players": [
+                    Player(id=None, team_id=None, name=name)
+                    for name in ("bob", "Carol", "alice")
+                ],
+                "plate_appearances": [
+                    {
+                        "player_name": name,
+                        "outcome": "1B",
+                        "bases": 1,
+                        "rbis": 0,
+                        "runs_scored": 0,
+                    }
+                    for name in ("bob", "Carol", "alice")
+                ],
+                "warnings": [],
+            }
+        )
+
+        names = [row["name"] for row in repo.get_player_totals_by_name()]
+
+        assert names == ["alice", "bob", "Carol"]
+
+    def test_plate_appearance_lookups_use_indexes(self, repo):
+        """Test that plate appearances are searched by index, not scanned."""
+        with sqlite3.connect(repo.db_path) as conn:
+            plans = [
+                conn.execute(
+                    f"EXPLAIN QUERY PLAN SELECT outcome FROM plate_appearances "
+                    f"WHERE {column} = ?",
+                    (1,),
+                ).fetchall()
+                for column in ("player_id", "game_id")
+            ]
+
+        for column, plan in zip(("player_id", "game_id"), plans):
+            assert f"idx_plate_appearances_{column}" in plan[0][-1]
+
+    def test_failed_batch_in_session_leaves_no_rows(self, repo):
+        """Test that a batch failing partway through a session saves nothing."""
+        batch = [
+            {
+                "league": League(id=None, name="Fray", season="Spring 2025"),
+                "team": Team(id=None, league_id=None, name="Cyclones"),
+                "week": Week(None, None, 1, date(2025, 4, 1), date(2025, 4, 1)),
+                "game": Game(date=date(2025, 4, 1), game_number=1),
+                "players": [Player(id=None, team_id=None, name="Player One")],
+                # Unknown player: fails after games and players are inserted
+                "plate_appearances": [
+                    {
+                        "player_name": "Nobody",
+                        "outcome": "1B",
+                        "bases": 1,
+                        "rbis": 0,
+                        "runs_scored": 0,
+                    }
+                ],
+                "warnings": [],
+            }
+        ]
+
+        with repo.session():
+            with pytest.raises(KeyError):
+                repo.save_parsed_batch(batch)
+
+        with sqlite3.connect(repo.db_path) as conn:
+            counts = [
+                conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("leagues", "teams", "weeks", "games", "players")
+            ]
+        assert counts == [0, 0, 0, 0, 0]
+
+    def test_wipe_in_session_rolls_back_with_session(self, repo):
+        """Test that clearing data inside a failed session keeps the old rows."""
+        repo.save_league(League(id=None, name="Fray", season="Spring 2025"))
+
+        with pytest.raises(RuntimeError):
+            with repo.session():
+                repo.clear_all_data()
+                assert repo.list_leagues() == []
+                raise RuntimeError("reparse failed")
+
+        assert [league.name for league in repo.list_leagues()] == ["Fray"]
+
+    def test_nested_session_joins_outer_session(self, repo):
+        """Test that a session opened inside another commits with the outer one."""
+        with repo.session():
+            with repo.session():
+                repo.save_league(League(id=None, name="Inner", season="Fall"))
+            with sqlite3.connect(repo.db_path) as other:
+                assert other.execute("SELECT COUNT(*) FROM leagues").fetchone()[0] == 0
+
+        assert [league.name for league in repo.list_leagues()] == ["Inner"]
@@ -1,8 +1,10 @@
+import numpy as np
 import pytest
 
 from softball_statistics.calculators.stats_calculator import (
     calculate_batting_average,
     calculate_batting_stats,
+    calculate_batting_stats_batch,
     calculate_obp,
     calculate_ops,
     calculate_slg,
@@ -154,3 +156,69 @@ class TestStatsCalculator:
         assert stats["on_base_percentage"] == 0.000
         assert stats["slugging_percentage"] == 0.000
         assert stats["ops"] == 0.000
+
+    def test_calculate_batting_stats_batch_matches_scalar(self):
+        """Test batch calculation agrees with the per-player functions."""
+        rows = [
+            # AB, H, 1B, 2B, 3B, HR, BB, SF
+            (10, 3, 2, 1, 0, 0, 2, 0),
+            (8, 2, 1, 0, 0, 1, 1, 1),
+            (0, 0, 0, 0, 0, 0, 0, 0),
+            (4, 4, 0, 0, 0, 4, 0, 0),
+            # Ties where np.round disagrees with round(): 1/80 and 3/80
+            (80, 1, 1, 0, 0, 0, 0, 0),
+            (80, 3, 3, 0, 0, 0, 0, 0),
+        ]
+        columns = [np.array(col) for col in zip(*rows)]
+        batch = calculate_batting_stats_batch(*columns[:7], sf=columns[7])
+
+        for i, (ab, h, b1, b2, b3, hr, bb, sf) in enumerate(rows):
+            expected = calculate_batting_stats(
+                at_bats=ab,
+                hits=h,
+                singles=b1,
+                doubles=b2,
+                triples=b3,
+                home_runs=hr,
+                walks=bb,
+                strikeouts=0,
+                rbis=0,
+                runs_scored=0,
+                plate_appearances=ab + bb + sf,
+                sf=sf,
+            )
+            for key in (
+                "batting_average",
+                "on_base_percentage",
+                "slugging_percentage",
+                "ops",
+            ):
+                assert batch[key][i] == expected[key], (rows[i], key)
+
+    def test_calculate_batting_stats_batch_rounds_like_scalar(self):
+        """Test batch averages round ties exactly as calculate_batting_average."""
+        pairs = [(h, ab) for ab in range(1, 400) for h in range(ab + 1)]
+        hits, at_bats = (np.array(col) for col in zip(*pairs))
+
+        batch = calculate_batting_stats_batch(at_bats, hits, hits, 0, 0, 0, 0)
+
+        assert batch["batting_average"].tolist() == [
+            calculate_batting_average(h, ab) for h, ab in pairs
+        ]
+
+    def test_calculate_batting_stats_batch_zero_denominators(self):
+        """Test batch calculation returns 0.000 instead of dividing by zero."""
+        batch = calculate_batting_stats_batch(
+            at_bats=np.array([0, 0]),
+            hits=np.array([0, 0]),
+            singles=np.array([0, 0]),
+            doubles=np.array([0, 0]),
+            triples=np.array([0, 0]),
+            home_runs=np.array([0, 0]),
+            walks=np.array([0, 1]),
+        )
+
+        assert batch["batting_average"].tolist() == [0.0, 0.0]
+        assert batch["on_base_percentage"].tolist() == [0.0, 1.0]
+        assert batch["slugging_percentage"].tolist() == [0.0, 0.0]
+        assert batch["ops"].tolist() == [0.0, 1.0]
@@ -90,6 +90,77 @@ Player2,HR,F4+
             finally:
                 os.unlink(f.name)
 
+    def test_parse_does_not_touch_repository(self, tmp_path):
+        """Test that parse() validates the file without any repository calls."""
+        csv_file = tmp_path / "test-team-season-01.csv"
+        csv_file.write_text("Player Name,Attempt1\nPlayer1,HR*+\n")
+
+        parsed_data = self.use_case.parse(str(csv_file))
+
+        assert len(parsed_data["plate_appearances"]) == 1
+        assert self.mock_query_repo.mock_calls == []
+        assert self.mock_command_repo.mock_calls == []
+
+        self.mock_query_repo.game_exists.return_value = False
+        assert self.use_case.persist(parsed_data) is parsed_data
+        self.mock_command_repo.save_game_data.assert_called_once()
+
+    def test_persist_batch_skips_duplicate_games(self, tmp_path):
+        """Test that a batch reports games already seen earlier in the batch."""
+        csv_file = tmp_path / "test-team-season-01.csv"
+        csv_file.write_text("Player Name,Attempt1\nPlayer1,1B\n")
+        parsed_data = self.use_case.parse(str(csv_file))
+        self.mock_query_repo.game_exists.return_value = False
+
+        errors = self.use_case.persist_batch([parsed_data, parsed_data])
+
+        assert errors == [None, "Game already exists"]
+        (batch,) = self.mock_command_repo.save_parsed_batch.call_args.args
+        assert len(batch) == 1
+
+    def test_persist_batch_fails_only_invalid_games(self, tmp_path):
+        """Test that one invalid game does not stop the rest of the batch saving."""
+        repo = SQLiteRepository(str(tmp_path / "test.db"))
+        use_case = ProcessGameUseCase(self.parser, repo, repo)
+        parsed_list = []
+        for game in ("01", "00", "02"):
+            csv_file = tmp_path / f"test-team-season-{game}.csv"
+            csv_file.write_text("Player Name,Attempt1\nPlayer1,1B\n")
+            parsed_list.append(use_case.parse(str(csv_file)))
+
+        with repo.session():
+            errors = use_case.persist_batch(parsed_list)
+
+        assert errors == [None, "Week number must be positive", None]
+        for parsed_data in (parsed_list[0], parsed_list[2]):
+            metadata = parsed_data["metadata"]
+            assert repo.game_exists(
+                metadata["league"],
+                metadata["team"],
+                metadata["season"],
+                metadata["game"],
+            )
+
+    def test_persist_batch_falls_back_to_per_game_saves(self, tmp_path):
+        """Test that a failed batch insert is retried game by game."""
+        parsed_list = []
+        for game in ("01", "02"):
+            csv_file = tmp_path / f"test-team-season-{game}.csv"
+            csv_file.write_text("Player Name,Attempt1\nPlayer1,1B\n")
+            parsed_list.append(self.use_case.parse(str(csv_file)))
+        self.mock_query_repo.game_exists.return_value = False
+
+        def save_parsed_batch(batch):
+            if any(objects["game"].game_number == 2 for objects in batch):
+                raise ValueError("insert failed")
+
+        self.mock_command_repo.save_parsed_batch.side_effect = save_parsed_batch
+
+        errors = self.use_case.persist_batch(parsed_list)
+
+        assert errors == [None, "insert failed"]
+        assert self.mock_command_repo.save_parsed_batch.call_count == 3
+
 
 class TestCalculateStatsUseCase:
     def test_league_summary_combines_same_league_team_across_seasons(self, tmp_path):
@@ -116,6 +187,70 @@ class TestCalculateStatsUseCase:
         assert len(other_rows) == 1
         assert other_rows[0]["Games Played"] == 1
 
+    def test_cumulative_stats_all_teams_matches_per_team(self, tmp_path):
+        """All-teams cumulative stats should equal per-team lookups."""
+        repo = SQLiteRepository(str(tmp_path / "test.db"))
+        self._save_game(repo, "Fray", "Spring 2025", "Cyclones", 1)
+        self._save_game(repo, "Fray", "Summer 2025", "Cyclones", 2)
+        self._save_game(repo, "Other League", "Spring 2025", "Bolts", 3)
+        use_case = CalculateStatsUseCase(repo)
+
+        all_stats = use_case.get_cumulative_stats_all_teams()
+
+        assert list(all_stats) == ["Cyclones", "Bolts"]
+        for team_name, stats in all_stats.items():
+            assert stats == use_case.get_cumulative_team_stats(team_name)
+        assert all_stats["Cyclones"]["games_played"] == 2
+
+    def test_caching_reuses_cumulative_stats_only_inside_block(self, tmp_path):
+        """Cumulative stats are computed once per team set while caching."""
+        repo = SQLiteRepository(str(tmp_path / "test.db"))
+        self._save_game(repo, "Fray", "Spring 2025", "Cyclones", 1)
+        use_case = CalculateStatsUseCase(repo)
+
+        with use_case.caching():
+            first = use_case.get_cumulative_team_stats("Cyclones")
+            assert use_case.get_cumulative_team_stats("Cyclones") is first
+        assert use_case.get_cumulative_team_stats("Cyclones") is not first
+        assert use_case.get_cumulative_team_stats("Cyclones") == first
+
+    def test_team_game_player_stats_matches_per_game(self, tmp_path):
+        """One-query team lookup should equal per-game player stats."""
+        repo = SQLiteRepository(str(tmp_path / "test.db"))
+        league_id = repo.save_league(League(None, "Fray", "Spring 2025"))
+        team_id = repo.save_team(Team(None, league_id, "Cyclones"))
+        week_id = repo.save_week(
+            Week(None, league_id, 1, date(2025, 1, 1), date(2025, 1, 7))
+        )
+        alice = repo.save_player(Player(None, team_id, "Alice"))
+        bob = repo.save_player(Player(None, team_id, "Bob"))
+        game_ids = [
+            repo.save_game(Game(None, week_id, team_id, date(2025, 1, 1), number))
+            for number in (1, 2)
+        ]
+        for game_id in game_ids:
+            repo.save_plate_appearance(
+                PlateAppearance(None, bob, game_id, "2B", bases=2, rbis=1)
+            )
+            repo.save_plate_appearance(PlateAppearance(None, alice, game_id, "K"))
+        repo.save_plate_appearance(PlateAppearance(None, alice, game_ids[1], "BB"))
+        use_case = CalculateStatsUseCase(repo)
+
+        by_game = use_case.get_team_game_player_stats(team_id)
+
+        assert list(by_game) == game_ids
+        games = [game for game, _ in use_case.iter_team_game_player_stats(team_id)]
+        assert games == [
+            {key: game[key] for key in games[0]}
+            for game in use_case.get_team_games_stats(team_id)
+        ]
+        for game_id in game_ids:
+            assert by_game[game_id] == use_case.get_game_player_stats(game_id)
+        assert [row["player_name"] for row in by_game[game_ids[0]]] == [
+            "Alice",
+            "Bob",
+        ]
+
     def _save_game(
         self,
         repo: SQLiteRepository,